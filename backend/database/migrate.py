@@ -6,13 +6,29 @@ Run this once to set up the database schema
 
 import asyncio
 import os
+import re
 import sys
+import traceback
 from pathlib import Path
+from typing import List
 
 # Add parent directory to path so we can import services
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from services.database import db
+from services.database import db, PGVECTOR_ENABLED
+
+# Line comments ("-- ...") - schema.sql has no "--" inside string literals
+_COMMENT_RE = re.compile(r'--[^\n]*')
+
+
+def split_statements(schema_sql: str) -> List[str]:
+    """
+    Split a SQL script into individual statements
+    Naive ';' split is safe here: schema.sql has no quoted semicolons or
+    dollar-quoted function bodies
+    """
+    schema_sql = _COMMENT_RE.sub('', schema_sql)
+    return [stmt for stmt in map(str.strip, schema_sql.split(';')) if stmt]
 
 
 async def run_migration():
@@ -32,20 +48,41 @@ async def run_migration():
         with open(schema_file, 'r', encoding='utf-8') as f:
             schema_sql = f.read()
         
-        # Execute schema (split by semicolons for multiple statements)
-        # asyncpg.execute can handle multiple statements
-        print("[*] Creating tables...")
-        await db.execute(schema_sql)
+        # Tables/extensions/ALTERs run sequentially (foreign keys depend on
+        # file order); indexes are independent, so build them in parallel on
+        # separate pool connections
+        statements = split_statements(schema_sql)
+        index_statements = [s for s in statements if s.upper().startswith('CREATE INDEX')]
+        ordered_statements = [s for s in statements if s not in index_statements]
+        
+        # One connection + one transaction: a single commit for all the DDL, and
+        # a half-applied schema can't be left behind if a statement fails
+        print(f"[*] Creating tables ({len(ordered_statements)} statements, one transaction)...")
+        async with db.session() as connection:
+            for stmt in ordered_statements:
+                await connection.execute(stmt)
+        
+        print(f"[*] Creating indexes ({len(index_statements)} statements, in parallel)...")
+        await asyncio.gather(*[db.execute(stmt) for stmt in index_statements])
+        
+        if await db.upgrade_centroid_column():
+            print("[*] Converted clusters.centroid from JSONB to float8[]")
+        if await db.upgrade_member_count_column():
+            print("[*] Added and backfilled clusters.member_count")
+        
+        if PGVECTOR_ENABLED:
+            print("[*] Applying pgvector schema...")
+            await db.execute((Path(__file__).parent / "pgvector.sql").read_text(encoding="utf-8"))
         
         print("[SUCCESS] Migration completed successfully!")
         
         # Verify tables were created
         print("\n[*] Verifying tables...")
         tables = await db.fetch("""
-            SELECT table_name 
-            FROM information_schema.tables 
-            WHERE table_schema = 'public'
-            ORDER BY table_name
+            SELECT relname AS table_name
+            FROM pg_class
+            WHERE relnamespace = 'public'::regnamespace AND relkind IN ('r', 'p')
+            ORDER BY relname
         """)
         
         print(f"[SUCCESS] Found {len(tables)} tables:")
@@ -54,7 +91,6 @@ async def run_migration():
         
     except Exception as e:
         print(f"[ERROR] Migration failed: {e}")
-        import traceback
         traceback.print_exc()
     finally:
         await db.close()
@@ -0,0 +1,22 @@
+-- Optional pgvector support (applied only when PGVECTOR=1)
+-- Requires the pgvector extension to be available on the server
+
+CREATE EXTENSION IF NOT EXISTS vector;
+
+-- Server-side copy of the JSONB embedding, kept in sync by Postgres itself
+-- (generated column), so the write path is unchanged.
+-- 384 = all-MiniLM-L6-v2 embedding size
+ALTER TABLE graph_nodes ADD COLUMN IF NOT EXISTS embedding_vec vector(384)
+    GENERATED ALWAYS AS ((embedding::text)::vector(384)) STORED;
+
+-- Approximate nearest-neighbour index for cosine similarity search
+CREATE INDEX IF NOT EXISTS idx_graph_nodes_embedding_hnsw ON graph_nodes
+    USING hnsw (embedding_vec vector_cosine_ops) WITH (m = 16, ef_construction = 64);
+
+-- Same for cluster centroids (float8[] casts straight to vector), so picking a
+-- node's cluster is one ORDER BY ... LIMIT 1 instead of loading every centroid
+ALTER TABLE clusters ADD COLUMN IF NOT EXISTS centroid_vec vector(384)
+    GENERATED ALWAYS AS (centroid::vector(384)) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_clusters_centroid_hnsw ON clusters
+    USING hnsw (centroid_vec vector_cosine_ops) WITH (m = 16, ef_construction = 64);
@@ -54,20 +54,41 @@ CREATE TABLE IF NOT EXISTS graph_nodes (
     depth INTEGER DEFAULT 0,
     last_updated TIMESTAMP DEFAULT NOW(),
     metadata JSONB DEFAULT '{}'::jsonb,
+    embedding_i8 BYTEA,
+    embedding_scale REAL,
+    content_hash BYTEA,
     CONSTRAINT fk_parent FOREIGN KEY (parent_id) 
         REFERENCES graph_nodes(id) ON DELETE CASCADE,
     CONSTRAINT fk_node_meeting FOREIGN KEY (meeting_id) 
         REFERENCES meetings(id) ON DELETE CASCADE
 );
 
+-- int8-quantized copy of embedding (embedding ~= embedding_i8 * embedding_scale),
+-- written alongside it; similarity scans read this instead of the JSONB
+ALTER TABLE graph_nodes ADD COLUMN IF NOT EXISTS embedding_i8 BYTEA;
+ALTER TABLE graph_nodes ADD COLUMN IF NOT EXISTS embedding_scale REAL;
+-- Fingerprint of embedding/summary/parent_id/depth/metadata: upserts that
+-- would rewrite a node with identical content are skipped server-side
+ALTER TABLE graph_nodes ADD COLUMN IF NOT EXISTS content_hash BYTEA;
+
 -- Note: If migrating from old schema, user_id column may still exist
 -- It should be made nullable or removed after migration
 
 -- Create indexes for faster queries
 CREATE INDEX IF NOT EXISTS idx_graph_nodes_meeting_id ON graph_nodes(meeting_id);
 CREATE INDEX IF NOT EXISTS idx_graph_nodes_parent_id ON graph_nodes(parent_id);
-CREATE INDEX IF NOT EXISTS idx_graph_nodes_meeting_parent ON graph_nodes(meeting_id, parent_id);
+-- Children by (meeting_id, parent_id) with id carried in the index: child-id
+-- lookups and the recursive subtree walk are index-only scans (no heap fetch).
+-- Supersedes the plain two-column index. Not CONCURRENTLY: this script runs
+-- as one multi-statement batch, which CREATE INDEX CONCURRENTLY can't join
+CREATE INDEX IF NOT EXISTS idx_graph_nodes_meeting_parent_cover ON graph_nodes(meeting_id, parent_id) INCLUDE (id);
+DROP INDEX IF EXISTS idx_graph_nodes_meeting_parent;
 CREATE INDEX IF NOT EXISTS idx_graph_nodes_last_updated ON graph_nodes(last_updated);
+-- Per-meeting reads ordered by last_updated (all-nodes, snapshot) come back
+-- pre-sorted, and the ETag probe (count + MAX(last_updated)) is index-only
+CREATE INDEX IF NOT EXISTS idx_graph_nodes_meeting_last_updated ON graph_nodes(meeting_id, last_updated);
+-- Root lookup: one tiny entry per meeting
+CREATE INDEX IF NOT EXISTS idx_graph_nodes_meeting_root ON graph_nodes(meeting_id) WHERE parent_id IS NULL;
 
 -- Graph edges table
 -- Now uses meeting_id instead of user_id
@@ -101,7 +122,10 @@ CREATE INDEX IF NOT EXISTS idx_graph_edges_to_node ON graph_edges(to_node);
 CREATE TABLE IF NOT EXISTS clusters (
     cluster_id INTEGER NOT NULL,
     meeting_id VARCHAR(255) NOT NULL,
-    centroid JSONB NOT NULL,
+    centroid DOUBLE PRECISION[] NOT NULL,
+    -- Embeddings averaged into centroid (older databases gain it through
+    -- Database.upgrade_member_count_column)
+    member_count INTEGER NOT NULL DEFAULT 0,
     color VARCHAR(7),
     created_at TIMESTAMP DEFAULT NOW(),
     updated_at TIMESTAMP DEFAULT NOW(),
@@ -113,6 +137,19 @@ CREATE TABLE IF NOT EXISTS clusters (
 
 -- Index for clusters
 CREATE INDEX IF NOT EXISTS idx_clusters_meeting_id ON clusters(meeting_id);
+-- get_clusters (meeting_id = $1 ORDER BY cluster_id) reads rows in order, no Sort
+CREATE INDEX IF NOT EXISTS idx_clusters_meeting_cluster ON clusters(meeting_id, cluster_id);
+
+-- Cluster IDs come from one sequence: nextval() is atomic, so concurrent writers
+-- never get the same ID and allocation needs no MAX(cluster_id) scan.
+-- Caught up with the existing rows on every migration run, but only ever moved
+-- forward: IDs other processes have drawn (even uncommitted) are never reissued
+CREATE SEQUENCE IF NOT EXISTS clusters_cluster_id_seq MINVALUE 0 START 0 OWNED BY clusters.cluster_id;
+SELECT setval('clusters_cluster_id_seq', GREATEST(
+    (SELECT COALESCE(MAX(cluster_id), -1) + 1 FROM clusters),
+    (SELECT CASE WHEN is_called THEN last_value + 1 ELSE last_value END FROM clusters_cluster_id_seq)
+), false);
+ALTER TABLE clusters ALTER COLUMN cluster_id SET DEFAULT nextval('clusters_cluster_id_seq');
 
 -- Cluster members table (junction table)
 -- Now uses meeting_id instead of user_id
@@ -131,6 +168,9 @@ CREATE TABLE IF NOT EXISTS cluster_members (
 CREATE INDEX IF NOT EXISTS idx_cluster_members_cluster_id ON cluster_members(cluster_id);
 CREATE INDEX IF NOT EXISTS idx_cluster_members_node_id ON cluster_members(node_id);
 CREATE INDEX IF NOT EXISTS idx_cluster_members_meeting_id ON cluster_members(meeting_id);
+-- Member lookups filter on both columns, and so does the ON DELETE CASCADE from
+-- clusters(cluster_id, meeting_id) when a meeting's graph is reset
+CREATE INDEX IF NOT EXISTS idx_cluster_members_meeting_cluster ON cluster_members(meeting_id, cluster_id);
 
 -- Graphs table (kept for compatibility, but not used in v2)
 CREATE TABLE IF NOT EXISTS graphs (
@@ -156,10 +196,25 @@ CREATE TABLE IF NOT EXISTS transcriptions (
 CREATE INDEX IF NOT EXISTS idx_transcriptions_meeting_id ON transcriptions(meeting_id);
 CREATE INDEX IF NOT EXISTS idx_transcriptions_updated_at ON transcriptions(updated_at);
 
+-- Transcription chunks table (append-only)
+-- One row per transcribed chunk: appending is an INSERT instead of rewriting the
+-- meeting's whole TOASTed transcript. The full text is string_agg'd on read;
+-- the transcriptions table above only holds text saved before this table existed
+CREATE TABLE IF NOT EXISTS transcription_chunks (
+    meeting_id VARCHAR(255) NOT NULL,
+    seq BIGSERIAL,
+    text TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT NOW(),
+    PRIMARY KEY (meeting_id, seq),
+    CONSTRAINT fk_transcription_chunk_meeting FOREIGN KEY (meeting_id) 
+        REFERENCES meetings(id) ON DELETE CASCADE
+);
+
 -- Comments for documentation
 COMMENT ON TABLE meetings IS 'Stores meeting metadata - each meeting belongs to a user and contains its own graph';
 COMMENT ON TABLE graph_nodes IS 'Stores all graph nodes with embeddings and relationships - linked to meetings';
 COMMENT ON TABLE graph_edges IS 'Stores explicit edges between nodes - linked to meetings';
 COMMENT ON TABLE clusters IS 'Stores cluster information for node grouping - linked to meetings';
 COMMENT ON TABLE cluster_members IS 'Junction table linking nodes to clusters - linked to meetings';
+COMMENT ON TABLE transcription_chunks IS 'Append-only transcript chunks - one row per transcribed chunk, linked to meetings';
 
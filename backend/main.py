@@ -3,393 +3,456 @@ MeetMap Prototype - Main FastAPI Application
 Simple pipeline: Receive chunk → Extract nodes → Return to frontend
 """
 
-from fastapi import FastAPI, Query, Body
+from fastapi import FastAPI, Query, Request, Response, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 import uvicorn
 from dotenv import load_dotenv
 import os
+import asyncio
 import time
-from typing import Optional
+import logging
+import uuid
+import hashlib
+from pathlib import Path
+from typing import Optional, List
 from contextlib import asynccontextmanager
+from functools import lru_cache
+from importlib.util import find_spec
 from pydantic import BaseModel
-import base64
-import tempfile
-import io
-import httpx
 
 from services.meetmap_service import MeetMapService
-from services.database import db
-from models.schemas import TranscriptChunk
+from services.database import db, PGVECTOR_ENABLED
+from services.graph_manager import cluster_color
+from services.batcher import AsyncBatcher
+from services.log_config import setup_logging
+from database.migrate import split_statements
+from models.schemas import TranscriptChunk, NODE_LIST, EDGE_LIST
 
 load_dotenv()
+setup_logging()
+logger = logging.getLogger(__name__)
 
 app_start = time.time()
-print(f"\n[{time.strftime('%H:%M:%S')}] [*] Starting MeetMap Backend...")
+logger.info("[*] Starting MeetMap Backend...")
 
-# Database lifecycle events using lifespan (modern FastAPI approach)
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """Manage database connection lifecycle"""
-    # Startup
+
+SCHEMA_FILE = Path(__file__).parent / "database" / "schema.sql"
+PGVECTOR_SCHEMA_FILE = Path(__file__).parent / "database" / "pgvector.sql"
+
+
+@lru_cache(maxsize=1)
+def _load_schema_sql() -> Optional[str]:
+    """schema.sql contents, read from disk once per process (None if missing)"""
+    return SCHEMA_FILE.read_text(encoding="utf-8") if SCHEMA_FILE.exists() else None
+
+
+@lru_cache(maxsize=1)
+def _load_schema_statements() -> tuple:
+    """schema.sql split into individual statements (parsed once per process)"""
+    schema_sql = _load_schema_sql()
+    return tuple(split_statements(schema_sql)) if schema_sql else ()
+
+# Startup migration switch - set RUN_MIGRATIONS=0 when migrations run as a
+# one-shot deploy job (python database/migrate.py) instead of on every boot
+RUN_MIGRATIONS = os.getenv("RUN_MIGRATIONS", "1") == "1"
+# Arbitrary app-wide key: only one process runs DDL at a time
+MIGRATION_LOCK_KEY = 727424242
+
+
+async def run_startup_migration_locked():
+    """Run the startup migration under an advisory lock (workers booting together queue up)"""
+    if not RUN_MIGRATIONS:
+        logger.info("[*] RUN_MIGRATIONS=0 - skipping startup migration")
+        return
+    async with db.advisory_lock(MIGRATION_LOCK_KEY):
+        await run_startup_migration()
+
+
+# Run migration automatically (creates tables if they don't exist)
+async def run_startup_migration():
+    """Create/upgrade the schema at startup (idempotent - schema.sql uses IF NOT EXISTS)"""
     try:
-        print(f"[{time.strftime('%H:%M:%S')}] [*] Connecting to database...")
-        await db.connect()
-        print(f"[{time.strftime('%H:%M:%S')}] [SUCCESS] Database connected")
-        
-        # Run migration automatically (creates tables if they don't exist)
-        # This is safe because schema.sql uses "CREATE TABLE IF NOT EXISTS"
-        try:
-            from pathlib import Path
-            schema_file = Path(__file__).parent / "database" / "schema.sql"
-            if schema_file.exists():
-                print(f"[{time.strftime('%H:%M:%S')}] [*] Running database migration...")
-                with open(schema_file, 'r', encoding='utf-8') as f:
-                    schema_sql = f.read()
-                
-                # Parse SQL into individual statements properly
-                # Handle multi-line statements by tracking when we're inside a statement
-                lines = schema_sql.split('\n')
-                statements = []
-                current_stmt = []
-                
-                for line in lines:
-                    stripped = line.strip()
-                    # Skip COMMENT statements and empty/comment-only lines
-                    if stripped.upper().startswith('COMMENT') or not stripped or stripped.startswith('--'):
-                        continue
-                    # Remove inline comments
-                    if '--' in line:
-                        line = line[:line.index('--')].strip()
-                        if not line:
-                            continue
-                    
-                    current_stmt.append(line)
-                    
-                    # If line ends with semicolon, we have a complete statement
-                    if line.rstrip().endswith(';'):
-                        stmt = ' '.join(current_stmt).strip()
-                        if stmt and len(stmt) > 5:  # Ignore very short statements
-                            statements.append(stmt.rstrip(';').strip())
-                        current_stmt = []
-                
-                # If there's a remaining statement without semicolon, add it
-                if current_stmt:
-                    stmt = ' '.join(current_stmt).strip()
-                    if stmt and len(stmt) > 5:
-                        statements.append(stmt)
-                
-                # Separate CREATE TABLE from other statements
-                create_table_statements = []
-                other_statements = []
-                
-                for stmt in statements:
-                    stmt_upper = stmt.upper().strip()
-                    if stmt_upper.startswith('CREATE TABLE'):
-                        create_table_statements.append(stmt)
-                    elif stmt_upper.startswith('CREATE') or stmt_upper.startswith('ALTER'):
-                        other_statements.append(stmt)
-                
-                # Execute CREATE TABLE statements first
-                # IMPORTANT: Create meetings table FIRST (before graph_nodes, etc.) since they have foreign keys
-                print(f"[{time.strftime('%H:%M:%S')}] [*] Creating tables ({len(create_table_statements)} statements)...")
-                
-                # Sort statements to ensure meetings table is created first
-                def get_table_priority(stmt):
-                    stmt_upper = stmt.upper()
-                    if 'USERS' in stmt_upper:
-                        return 0  # Highest priority - no dependencies
-                    elif 'MEETINGS' in stmt_upper:
-                        return 1  # Depends on users (for foreign key in user_meetings)
-                    elif 'USER_MEETINGS' in stmt_upper:
-                        return 2  # Depends on users and meetings
-                    elif 'TRANSCRIPTIONS' in stmt_upper:
-                        return 3  # Depends on meetings
-                    elif 'GRAPH_NODES' in stmt_upper or 'GRAPH_EDGES' in stmt_upper:
-                        return 4  # Depends on meetings
-                    elif 'CLUSTERS' in stmt_upper or 'CLUSTER_MEMBERS' in stmt_upper:
-                        return 5  # Depends on meetings
-                    else:
-                        return 6
-                
-                create_table_statements.sort(key=get_table_priority)
-                
-                for stmt in create_table_statements:
+        schema_sql = _load_schema_sql()
+        if schema_sql:
+            logger.info("[*] Running database migration...")
+            try:
+                # One round-trip: a multi-statement script runs as a single implicit
+                # transaction, and every statement is CREATE ... IF NOT EXISTS
+                await db.execute(schema_sql)
+                logger.info("[SUCCESS] Schema script applied")
+            except Exception as script_error:
+                # e.g. a pre-meeting_id database, where an index on the missing column
+                # rolls back the whole script - apply what we can one statement at a
+                # time and let the upgrade below add the columns
+                logger.warning("[WARNING] Schema script failed (%s), applying statements individually...", script_error)
+                for stmt in _load_schema_statements():
                     try:
                         await db.execute(stmt)
-                        # Extract table name for logging
-                        parts = stmt.upper().split('CREATE TABLE')
-                        if len(parts) > 1:
-                            table_part = parts[1].strip().split()[0]
-                            table_name = table_part.replace('IF', '').replace('NOT', '').replace('EXISTS', '').strip()
-                            print(f"[{time.strftime('%H:%M:%S')}] [SUCCESS] Table created/verified: {table_name}")
                     except Exception as e:
-                        error_msg = str(e).lower()
-                        if 'already exists' not in error_msg:
-                            print(f"[{time.strftime('%H:%M:%S')}] [ERROR] Failed to create table: {e}")
-                            # Show first 150 chars of statement for debugging
-                            print(f"[{time.strftime('%H:%M:%S')}] [ERROR] Statement: {stmt[:150]}...")
-                            # Don't raise - continue with other tables
-                
-                # Then execute indexes and other statements
-                if other_statements:
-                    print(f"[{time.strftime('%H:%M:%S')}] [*] Creating indexes and constraints ({len(other_statements)} statements)...")
-                    for stmt in other_statements:
-                        try:
-                            await db.execute(stmt)
-                        except Exception as e:
-                            error_msg = str(e).lower()
-                            # These errors are often expected (already exists, etc.)
-                            if 'already exists' not in error_msg:
-                                # Only log if it's not a "does not exist" error (tables should exist by now)
-                                if 'does not exist' in error_msg:
-                                    print(f"[{time.strftime('%H:%M:%S')}] [WARNING] Index/constraint skipped (table may not exist yet): {stmt[:50]}...")
-                                else:
-                                    print(f"[{time.strftime('%H:%M:%S')}] [WARNING] Index/constraint may have failed: {stmt[:50]}... Error: {e}")
-                
-                # Verify tables - especially check for meetings table
-                tables = await db.fetch("""
-                    SELECT table_name 
-                    FROM information_schema.tables 
-                    WHERE table_schema = 'public'
-                    ORDER BY table_name
+                        if 'already exists' not in str(e).lower():
+                            logger.warning("[WARNING] Statement may have failed: %s... Error: %s", stmt[:50], e)
+            
+            # Verify tables - especially check for meetings table
+            tables = await db.fetch("""
+                SELECT relname AS table_name
+                FROM pg_class
+                WHERE relnamespace = 'public'::regnamespace AND relkind IN ('r', 'p')
+                ORDER BY relname
+            """)
+            table_names = [t['table_name'] for t in tables]
+            logger.info("[SUCCESS] Database ready - %s tables found: %s", len(tables), ', '.join(table_names))
+            
+            # Critical check: ensure meetings table exists
+            if 'meetings' not in table_names:
+                logger.error("[ERROR] CRITICAL: meetings table not found after migration!")
+                logger.error("[ERROR] This will cause API failures. Attempting to create meetings table manually...")
+                try:
+                    await db.execute("""
+                        CREATE TABLE IF NOT EXISTS meetings (
+                            id VARCHAR(255) PRIMARY KEY,
+                            user_id VARCHAR(255),
+                            title VARCHAR(255) NOT NULL DEFAULT 'Untitled Meeting',
+                            description TEXT,
+                            created_at TIMESTAMP DEFAULT NOW(),
+                            ended_at TIMESTAMP,
+                            metadata JSONB DEFAULT '{}'::jsonb
+                        )
+                    """)
+                    await db.execute("CREATE INDEX IF NOT EXISTS idx_meetings_user_id ON meetings(user_id)")
+                    await db.execute("CREATE INDEX IF NOT EXISTS idx_meetings_created_at ON meetings(created_at)")
+                    logger.info("[SUCCESS] meetings table created manually")
+                except Exception as manual_create_error:
+                    logger.error("[ERROR] Failed to create meetings table manually: %s", manual_create_error)
+                    raise RuntimeError("meetings table is required but could not be created")
+            
+            # Check if graph_nodes has meeting_id column (migration check)
+            try:
+                columns = await db.fetch("""
+                    SELECT column_name, is_nullable
+                    FROM information_schema.columns 
+                    WHERE table_schema = 'public' 
+                    AND table_name = 'graph_nodes'
+                    AND column_name IN ('meeting_id', 'user_id')
                 """)
-                table_names = [t['table_name'] for t in tables]
-                print(f"[{time.strftime('%H:%M:%S')}] [SUCCESS] Database ready - {len(tables)} tables found: {', '.join(table_names)}")
                 
-                # Critical check: ensure meetings table exists
-                if 'meetings' not in table_names:
-                    print(f"[{time.strftime('%H:%M:%S')}] [ERROR] CRITICAL: meetings table not found after migration!")
-                    print(f"[{time.strftime('%H:%M:%S')}] [ERROR] This will cause API failures. Attempting to create meetings table manually...")
-                    try:
-                        await db.execute("""
-                            CREATE TABLE IF NOT EXISTS meetings (
-                                id VARCHAR(255) PRIMARY KEY,
-                                user_id VARCHAR(255),
-                                title VARCHAR(255) NOT NULL DEFAULT 'Untitled Meeting',
-                                description TEXT,
-                                created_at TIMESTAMP DEFAULT NOW(),
-                                ended_at TIMESTAMP,
-                                metadata JSONB DEFAULT '{}'::jsonb
-                            )
-                        """)
-                        await db.execute("CREATE INDEX IF NOT EXISTS idx_meetings_user_id ON meetings(user_id)")
-                        await db.execute("CREATE INDEX IF NOT EXISTS idx_meetings_created_at ON meetings(created_at)")
-                        print(f"[{time.strftime('%H:%M:%S')}] [SUCCESS] meetings table created manually")
-                    except Exception as manual_create_error:
-                        print(f"[{time.strftime('%H:%M:%S')}] [ERROR] Failed to create meetings table manually: {manual_create_error}")
-                        raise RuntimeError("meetings table is required but could not be created")
+                has_meeting_id = any(col['column_name'] == 'meeting_id' for col in columns)
+                user_id_info = next((col for col in columns if col['column_name'] == 'user_id'), None)
+                user_id_is_nullable = user_id_info and user_id_info['is_nullable'] == 'YES'
                 
-                # Check if graph_nodes has meeting_id column (migration check)
-                try:
-                    columns = await db.fetch("""
-                        SELECT column_name, is_nullable
-                        FROM information_schema.columns 
-                        WHERE table_schema = 'public' 
-                        AND table_name = 'graph_nodes'
-                        AND column_name IN ('meeting_id', 'user_id')
-                    """)
-                    
-                    has_meeting_id = any(col['column_name'] == 'meeting_id' for col in columns)
-                    user_id_info = next((col for col in columns if col['column_name'] == 'user_id'), None)
-                    user_id_is_nullable = user_id_info and user_id_info['is_nullable'] == 'YES'
+                needs_migration = not has_meeting_id or (user_id_info and not user_id_is_nullable)
+                
+                if needs_migration:
+                    logger.warning("[WARNING] Running database migration to add meeting_id and make user_id nullable...")
                     
-                    needs_migration = not has_meeting_id or (user_id_info and not user_id_is_nullable)
+                    # Run migration: add meeting_id columns if missing
+                    if not has_meeting_id:
+                        await db.execute("ALTER TABLE graph_nodes ADD COLUMN IF NOT EXISTS meeting_id VARCHAR(255)")
+                        await db.execute("ALTER TABLE graph_edges ADD COLUMN IF NOT EXISTS meeting_id VARCHAR(255)")
+                        await db.execute("ALTER TABLE clusters ADD COLUMN IF NOT EXISTS meeting_id VARCHAR(255)")
+                        await db.execute("ALTER TABLE cluster_members ADD COLUMN IF NOT EXISTS meeting_id VARCHAR(255)")
                     
-                    if needs_migration:
-                        print(f"[{time.strftime('%H:%M:%S')}] [WARNING] Running database migration to add meeting_id and make user_id nullable...")
-                        
-                        # Run migration: add meeting_id columns if missing
-                        if not has_meeting_id:
-                            await db.execute("ALTER TABLE graph_nodes ADD COLUMN IF NOT EXISTS meeting_id VARCHAR(255)")
-                            await db.execute("ALTER TABLE graph_edges ADD COLUMN IF NOT EXISTS meeting_id VARCHAR(255)")
-                            await db.execute("ALTER TABLE clusters ADD COLUMN IF NOT EXISTS meeting_id VARCHAR(255)")
-                            await db.execute("ALTER TABLE cluster_members ADD COLUMN IF NOT EXISTS meeting_id VARCHAR(255)")
+                    # Make user_id nullable (if it exists and is NOT NULL)
+                    if user_id_info and not user_id_is_nullable:
+                        logger.info("[*] Making user_id nullable in existing tables...")
+                        try:
+                            await db.execute("ALTER TABLE graph_nodes ALTER COLUMN user_id DROP NOT NULL")
+                            logger.info("[SUCCESS] Made graph_nodes.user_id nullable")
+                        except Exception as e:
+                            logger.warning("[WARNING] Could not make graph_nodes.user_id nullable: %s", e)
                         
-                        # Make user_id nullable (if it exists and is NOT NULL)
-                        if user_id_info and not user_id_is_nullable:
-                            print(f"[{time.strftime('%H:%M:%S')}] [*] Making user_id nullable in existing tables...")
-                            try:
-                                await db.execute("ALTER TABLE graph_nodes ALTER COLUMN user_id DROP NOT NULL")
-                                print(f"[{time.strftime('%H:%M:%S')}] [SUCCESS] Made graph_nodes.user_id nullable")
-                            except Exception as e:
-                                print(f"[{time.strftime('%H:%M:%S')}] [WARNING] Could not make graph_nodes.user_id nullable: {e}")
-                            
-                            try:
-                                await db.execute("ALTER TABLE graph_edges ALTER COLUMN user_id DROP NOT NULL")
-                                print(f"[{time.strftime('%H:%M:%S')}] [SUCCESS] Made graph_edges.user_id nullable")
-                            except Exception as e:
-                                print(f"[{time.strftime('%H:%M:%S')}] [WARNING] Could not make graph_edges.user_id nullable: {e}")
-                            
-                            try:
-                                await db.execute("ALTER TABLE clusters ALTER COLUMN user_id DROP NOT NULL")
-                                print(f"[{time.strftime('%H:%M:%S')}] [SUCCESS] Made clusters.user_id nullable")
-                            except Exception as e:
-                                print(f"[{time.strftime('%H:%M:%S')}] [WARNING] Could not make clusters.user_id nullable: {e}")
-                            
-                            try:
-                                await db.execute("ALTER TABLE cluster_members ALTER COLUMN user_id DROP NOT NULL")
-                                print(f"[{time.strftime('%H:%M:%S')}] [SUCCESS] Made cluster_members.user_id nullable")
-                            except Exception as e:
-                                print(f"[{time.strftime('%H:%M:%S')}] [WARNING] Could not make cluster_members.user_id nullable: {e}")
+                        try:
+                            await db.execute("ALTER TABLE graph_edges ALTER COLUMN user_id DROP NOT NULL")
+                            logger.info("[SUCCESS] Made graph_edges.user_id nullable")
+                        except Exception as e:
+                            logger.warning("[WARNING] Could not make graph_edges.user_id nullable: %s", e)
                         
-                        # Drop user_id columns from all tables (no longer needed)
-                        print(f"[{time.strftime('%H:%M:%S')}] [*] Dropping user_id columns from all tables...")
-                        tables_to_clean = ['graph_nodes', 'graph_edges', 'clusters', 'cluster_members', 'meetings', 'graphs']
-                        for table_name in tables_to_clean:
-                            try:
-                                # Check if column exists
-                                col_check = await db.fetchrow("""
-                                    SELECT column_name
-                                    FROM information_schema.columns 
-                                    WHERE table_schema = 'public' 
-                                    AND table_name = $1
-                                    AND column_name = 'user_id'
-                                """, table_name)
-                                
-                                if col_check:
-                                    await db.execute(f"ALTER TABLE {table_name} DROP COLUMN IF EXISTS user_id")
-                                    print(f"[{time.strftime('%H:%M:%S')}] [SUCCESS] Dropped user_id from {table_name}")
-                            except Exception as e:
-                                print(f"[{time.strftime('%H:%M:%S')}] [WARNING] Could not drop user_id from {table_name}: {e}")
+                        try:
+                            await db.execute("ALTER TABLE clusters ALTER COLUMN user_id DROP NOT NULL")
+                            logger.info("[SUCCESS] Made clusters.user_id nullable")
+                        except Exception as e:
+                            logger.warning("[WARNING] Could not make clusters.user_id nullable: %s", e)
                         
-                        # Fix clusters table - drop and recreate if primary key is wrong
                         try:
-                            pk_constraint = await db.fetch("""
-                                SELECT constraint_name, constraint_type
-                                FROM information_schema.table_constraints
+                            await db.execute("ALTER TABLE cluster_members ALTER COLUMN user_id DROP NOT NULL")
+                            logger.info("[SUCCESS] Made cluster_members.user_id nullable")
+                        except Exception as e:
+                            logger.warning("[WARNING] Could not make cluster_members.user_id nullable: %s", e)
+                    
+                    # Drop user_id columns from all tables (no longer needed)
+                    logger.info("[*] Dropping user_id columns from all tables...")
+                    tables_to_clean = ['graph_nodes', 'graph_edges', 'clusters', 'cluster_members', 'meetings', 'graphs']
+                    for table_name in tables_to_clean:
+                        try:
+                            # Check if column exists
+                            col_check = await db.fetchrow("""
+                                SELECT column_name
+                                FROM information_schema.columns 
+                                WHERE table_schema = 'public' 
+                                AND table_name = $1
+                                AND column_name = 'user_id'
+                            """, table_name)
+                            
+                            if col_check:
+                                await db.execute(f"ALTER TABLE {table_name} DROP COLUMN IF EXISTS user_id")
+                                logger.info("[SUCCESS] Dropped user_id from %s", table_name)
+                        except Exception as e:
+                            logger.warning("[WARNING] Could not drop user_id from %s: %s", table_name, e)
+                    
+                    # Fix clusters table - drop and recreate if primary key is wrong
+                    try:
+                        pk_constraint = await db.fetch("""
+                            SELECT constraint_name, constraint_type
+                            FROM information_schema.table_constraints
+                            WHERE table_schema = 'public'
+                            AND table_name = 'clusters'
+                            AND constraint_type = 'PRIMARY KEY'
+                        """)
+                        
+                        needs_recreate = False
+                        if pk_constraint:
+                            # Check if the primary key includes user_id or doesn't have meeting_id
+                            pk_columns = await db.fetch("""
+                                SELECT column_name
+                                FROM information_schema.key_column_usage
                                 WHERE table_schema = 'public'
                                 AND table_name = 'clusters'
-                                AND constraint_type = 'PRIMARY KEY'
-                            """)
-                            
-                            needs_recreate = False
-                            if pk_constraint:
-                                # Check if the primary key includes user_id or doesn't have meeting_id
-                                pk_columns = await db.fetch("""
-                                    SELECT column_name
-                                    FROM information_schema.key_column_usage
-                                    WHERE table_schema = 'public'
-                                    AND table_name = 'clusters'
-                                    AND constraint_name = $1
-                                    ORDER BY ordinal_position
-                                """, pk_constraint[0]['constraint_name'])
-                                
-                                pk_cols = [col['column_name'] for col in pk_columns]
-                                if 'user_id' in pk_cols or ('cluster_id' in pk_cols and 'meeting_id' not in pk_cols):
-                                    needs_recreate = True
+                                AND constraint_name = $1
+                                ORDER BY ordinal_position
+                            """, pk_constraint[0]['constraint_name'])
                             
-                            if needs_recreate:
-                                print(f"[{time.strftime('%H:%M:%S')}] [*] Recreating clusters table with correct schema...")
-                                # Drop the table (this will cascade delete cluster_members)
-                                await db.execute("DROP TABLE IF EXISTS cluster_members CASCADE")
-                                await db.execute("DROP TABLE IF EXISTS clusters CASCADE")
-                                
-                                # Recreate with correct schema
-                                await db.execute("""
-                                    CREATE TABLE clusters (
-                                        cluster_id INTEGER NOT NULL,
-                                        meeting_id VARCHAR(255) NOT NULL,
-                                        centroid JSONB NOT NULL,
-                                        color VARCHAR(7),
-                                        created_at TIMESTAMP DEFAULT NOW(),
-                                        updated_at TIMESTAMP DEFAULT NOW(),
-                                        PRIMARY KEY (cluster_id, meeting_id),
-                                        CONSTRAINT fk_cluster_meeting FOREIGN KEY (meeting_id) 
-                                            REFERENCES meetings(id) ON DELETE CASCADE
-                                    )
-                                """)
-                                
-                                await db.execute("CREATE INDEX IF NOT EXISTS idx_clusters_meeting_id ON clusters(meeting_id)")
-                                
-                                # Recreate cluster_members table
-                                await db.execute("""
-                                    CREATE TABLE cluster_members (
-                                        cluster_id INTEGER NOT NULL,
-                                        node_id VARCHAR(255) NOT NULL,
-                                        meeting_id VARCHAR(255) NOT NULL,
-                                        PRIMARY KEY (cluster_id, node_id),
-                                        CONSTRAINT fk_cluster FOREIGN KEY (cluster_id, meeting_id) 
-                                            REFERENCES clusters(cluster_id, meeting_id) ON DELETE CASCADE,
-                                        CONSTRAINT fk_node FOREIGN KEY (node_id) 
-                                            REFERENCES graph_nodes(id) ON DELETE CASCADE
-                                    )
-                                """)
-                                
-                                await db.execute("CREATE INDEX IF NOT EXISTS idx_cluster_members_cluster_id ON cluster_members(cluster_id)")
-                                await db.execute("CREATE INDEX IF NOT EXISTS idx_cluster_members_node_id ON cluster_members(node_id)")
-                                await db.execute("CREATE INDEX IF NOT EXISTS idx_cluster_members_meeting_id ON cluster_members(meeting_id)")
-                                
-                                print(f"[{time.strftime('%H:%M:%S')}] [SUCCESS] Recreated clusters and cluster_members tables with correct schema")
-                        except Exception as e:
-                            print(f"[{time.strftime('%H:%M:%S')}] [WARNING] Could not fix clusters table: {e}")
+                            pk_cols = [col['column_name'] for col in pk_columns]
+                            if 'user_id' in pk_cols or ('cluster_id' in pk_cols and 'meeting_id' not in pk_cols):
+                                needs_recreate = True
                         
-                        # Create indexes for meeting_id if meeting_id was just added
-                        if not has_meeting_id:
-                            await db.execute("CREATE INDEX IF NOT EXISTS idx_graph_nodes_meeting_id ON graph_nodes(meeting_id)")
-                            await db.execute("CREATE INDEX IF NOT EXISTS idx_graph_edges_meeting_id ON graph_edges(meeting_id)")
+                        if needs_recreate:
+                            logger.info("[*] Recreating clusters table with correct schema...")
+                            # Drop the table (this will cascade delete cluster_members)
+                            await db.execute("DROP TABLE IF EXISTS cluster_members CASCADE")
+                            await db.execute("DROP TABLE IF EXISTS clusters CASCADE")
+                            
+                            # Recreate with correct schema
+                            await db.execute("""
+                                CREATE TABLE clusters (
+                                    cluster_id INTEGER NOT NULL,
+                                    meeting_id VARCHAR(255) NOT NULL,
+                                    centroid DOUBLE PRECISION[] NOT NULL,
+                                    member_count INTEGER NOT NULL DEFAULT 0,
+                                    color VARCHAR(7),
+                                    created_at TIMESTAMP DEFAULT NOW(),
+                                    updated_at TIMESTAMP DEFAULT NOW(),
+                                    PRIMARY KEY (cluster_id, meeting_id),
+                                    CONSTRAINT fk_cluster_meeting FOREIGN KEY (meeting_id) 
+                                        REFERENCES meetings(id) ON DELETE CASCADE
+                                )
+                            """)
+                            
                             await db.execute("CREATE INDEX IF NOT EXISTS idx_clusters_meeting_id ON clusters(meeting_id)")
+                            
+                            # Recreate cluster_members table
+                            await db.execute("""
+                                CREATE TABLE cluster_members (
+                                    cluster_id INTEGER NOT NULL,
+                                    node_id VARCHAR(255) NOT NULL,
+                                    meeting_id VARCHAR(255) NOT NULL,
+                                    PRIMARY KEY (cluster_id, node_id),
+                                    CONSTRAINT fk_cluster FOREIGN KEY (cluster_id, meeting_id) 
+                                        REFERENCES clusters(cluster_id, meeting_id) ON DELETE CASCADE,
+                                    CONSTRAINT fk_node FOREIGN KEY (node_id) 
+                                        REFERENCES graph_nodes(id) ON DELETE CASCADE
+                                )
+                            """)
+                            
+                            await db.execute("CREATE INDEX IF NOT EXISTS idx_cluster_members_cluster_id ON cluster_members(cluster_id)")
+                            await db.execute("CREATE INDEX IF NOT EXISTS idx_cluster_members_node_id ON cluster_members(node_id)")
                             await db.execute("CREATE INDEX IF NOT EXISTS idx_cluster_members_meeting_id ON cluster_members(meeting_id)")
-                        
-                        print(f"[{time.strftime('%H:%M:%S')}] [SUCCESS] Database migration completed")
-                    else:
-                        print(f"[{time.strftime('%H:%M:%S')}] [SUCCESS] Database schema is up to date (meeting_id columns exist, user_id is nullable)")
-                except Exception as migration_error:
-                    print(f"[{time.strftime('%H:%M:%S')}] [WARNING] Migration check failed (may be expected): {migration_error}")
-            else:
-                print(f"[{time.strftime('%H:%M:%S')}] [WARNING] Schema file not found, skipping migration")
-        except Exception as migration_error:
-            print(f"[{time.strftime('%H:%M:%S')}] [WARNING] Migration error (tables may already exist): {migration_error}")
-            # Continue anyway - tables might already exist
+                            
+                            logger.info("[SUCCESS] Recreated clusters and cluster_members tables with correct schema")
+                    except Exception as e:
+                        logger.warning("[WARNING] Could not fix clusters table: %s", e)
+                    
+                    # Create indexes for meeting_id if meeting_id was just added
+                    if not has_meeting_id:
+                        await db.execute("CREATE INDEX IF NOT EXISTS idx_graph_nodes_meeting_id ON graph_nodes(meeting_id)")
+                        await db.execute("CREATE INDEX IF NOT EXISTS idx_graph_edges_meeting_id ON graph_edges(meeting_id)")
+                        await db.execute("CREATE INDEX IF NOT EXISTS idx_clusters_meeting_id ON clusters(meeting_id)")
+                        await db.execute("CREATE INDEX IF NOT EXISTS idx_cluster_members_meeting_id ON cluster_members(meeting_id)")
+                    
+                    logger.info("[SUCCESS] Database migration completed")
+                else:
+                    logger.info("[SUCCESS] Database schema is up to date (meeting_id columns exist, user_id is nullable)")
+            except Exception as migration_error:
+                logger.warning("[WARNING] Migration check failed (may be expected): %s", migration_error)
             
+            if await db.upgrade_centroid_column():
+                logger.info("[SUCCESS] clusters.centroid converted from JSONB to float8[]")
+            if await db.upgrade_member_count_column():
+                logger.info("[SUCCESS] clusters.member_count added and backfilled")
+            
+            if PGVECTOR_ENABLED:
+                await apply_pgvector_schema()
+        else:
+            logger.warning("[WARNING] Schema file not found, skipping migration")
+    except Exception as migration_error:
+        logger.warning("[WARNING] Migration error (tables may already exist): %s", migration_error)
+        # Continue anyway - tables might already exist
+
+
+async def apply_pgvector_schema():
+    """Add the pgvector embedding column + HNSW index (database/pgvector.sql, PGVECTOR=1 only)"""
+    try:
+        await db.execute(PGVECTOR_SCHEMA_FILE.read_text(encoding="utf-8"))
+        # Connections opened before the extension existed have no vector codec
+        await db.expire_connections()
+        logger.info("[SUCCESS] pgvector schema applied")
+    except Exception as e:
+        logger.error("[ERROR] pgvector schema failed (is the vector extension installed?): %s", e)
+
+
+# Optional micro-batching of /api/transcript chunks (batch size 1 = direct path)
+MEETMAP_BATCH_SIZE = int(os.getenv("MEETMAP_BATCH_SIZE", 1))
+MEETMAP_FLUSH_MS = float(os.getenv("MEETMAP_FLUSH_MS", 50))
+
+
+# Cached /health result - refreshed in the background so probes never hit the DB
+HEALTH_REFRESH_SECONDS = float(os.getenv("HEALTH_REFRESH_SECONDS", 1.5))
+health_state: dict = {"status": "disconnected", "error": "Health check pending"}
+
+
+async def refresh_health_loop():
+    """Re-run db.health_check every HEALTH_REFRESH_SECONDS for the app's lifetime"""
+    global health_state
+    while True:
+        try:
+            health_state = await db.health_check()
+        except Exception as e:
+            health_state = {"status": "error", "error": str(e)}
+        await asyncio.sleep(HEALTH_REFRESH_SECONDS)
+
+
+async def start_database():
+    """Connect and migrate (logs and carries on if the DB is unavailable)"""
+    try:
+        logger.info("[*] Connecting to database...")
+        await db.connect()
+        logger.info("[SUCCESS] Database connected")
+        
+        await run_startup_migration_locked()
     except Exception as e:
-        print(f"[{time.strftime('%H:%M:%S')}] [ERROR] Database connection failed: {e}")
-        print(f"[{time.strftime('%H:%M:%S')}] [ERROR] Application requires database - some features may not work")
+        logger.error("[ERROR] Database connection failed: %s", e)
+        logger.error("[ERROR] Application requires database - some features may not work")
         # Don't raise - let app start but log the error clearly
+
+
+# Set up in lifespan (not at import) so the model load overlaps DB startup
+meetmap_service: Optional[MeetMapService] = None
+transcript_batcher: Optional[AsyncBatcher] = None
+
+
+async def start_services(app: FastAPI):
+    """Build MeetMapService (and the optional transcript batcher) off the event loop"""
+    global meetmap_service, transcript_batcher
+    service_start = time.time()
+    logger.info("[*] Initializing MeetMapService...")
+    meetmap_service = await MeetMapService.create()
+    app.state.meetmap_service = meetmap_service
+    service_elapsed = time.time() - service_start
+    logger.info("[SUCCESS] MeetMapService initialization complete (%.2fs)", service_elapsed)
+    
+    if MEETMAP_BATCH_SIZE > 1:
+        transcript_batcher = AsyncBatcher(
+            meetmap_service.extract_nodes_batch,
+            max_batch=MEETMAP_BATCH_SIZE,
+            flush_ms=MEETMAP_FLUSH_MS
+        )
+
+
+# Database lifecycle events using lifespan (modern FastAPI approach)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Manage database connection and service lifecycle"""
+    # Startup - DB connect/migrate and embedding model load run concurrently
+    await asyncio.gather(start_database(), start_services(app))
+    
+    app_elapsed = time.time() - app_start
+    logger.info("[*] Backend initialization complete! (Total: %.2fs)", app_elapsed)
+    
+    health_task = asyncio.create_task(refresh_health_loop())
     
     yield  # Application runs here
     
     # Shutdown
+    health_task.cancel()
+    if transcript_batcher:
+        await transcript_batcher.close()
+    if meetmap_service:
+        await meetmap_service.async_client.close()  # Release pooled OpenAI connections
+        await meetmap_service.close_embedder()
     try:
         await db.close()
-        print(f"[{time.strftime('%H:%M:%S')}] [SUCCESS] Database connection closed")
+        logger.info("[SUCCESS] Database connection closed")
     except Exception as e:
-        print(f"[{time.strftime('%H:%M:%S')}] [WARNING] Error closing database: {e}")
+        logger.warning("[WARNING] Error closing database: %s", e)
 
-app = FastAPI(title="MeetMap Prototype API", lifespan=lifespan)
+app = FastAPI(title="MeetMap Prototype API", lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # CORS middleware
 cors_start = time.time()
-# Get frontend URL from environment (for production) or use localhost defaults
-FRONTEND_URL = os.getenv("FRONTEND_URL", "")
-allowed_origins = [
-    "http://localhost:3000",
-    "http://localhost:5173",
-    "https://meetpmap.vercel.app",  # Vercel deployment
-    "https://graph.miless.app",  # Custom domain
-]
-if FRONTEND_URL:
-    allowed_origins.append(FRONTEND_URL)
 
+
+@lru_cache(maxsize=1)
+def _allowed_origins() -> tuple:
+    """Localhost defaults + deployed frontends, plus FRONTEND_URL from env (production)"""
+    origins = [
+        "http://localhost:3000",
+        "http://localhost:5173",
+        "https://meetpmap.vercel.app",  # Vercel deployment
+        "https://graph.miless.app",  # Custom domain
+    ]
+    frontend_url = os.getenv("FRONTEND_URL", "")
+    if frontend_url:
+        origins.append(frontend_url)
+    return tuple(origins)
+
+
+# Starlette's CORSMiddleware is pure ASGI and answers preflights itself,
+# without reaching the router. Keep any future middleware pure ASGI too -
+# BaseHTTPMiddleware wraps every request in extra tasks and streams
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=allowed_origins,
+    allow_origins=list(_allowed_origins()),
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Let browsers reuse a preflight for 2h (Chromium's cap) instead of the
+    # 10 min default - every JSON POST (transcript, chat) needs one
+    max_age=int(os.getenv("CORS_MAX_AGE", 7200)),
 )
 cors_elapsed = time.time() - cors_start
-print(f"[{time.strftime('%H:%M:%S')}] [SUCCESS] CORS middleware configured ({cors_elapsed:.3f}s)")
+logger.info("[SUCCESS] CORS middleware configured (%.3fs)", cors_elapsed)
 
-# Initialize services
-service_start = time.time()
-print(f"[{time.strftime('%H:%M:%S')}] [*] Initializing MeetMapService...")
-meetmap_service = MeetMapService()
-service_elapsed = time.time() - service_start
-print(f"[{time.strftime('%H:%M:%S')}] [SUCCESS] MeetMapService initialization complete ({service_elapsed:.2f}s)")
 
-app_elapsed = time.time() - app_start
-print(f"[{time.strftime('%H:%M:%S')}] [*] Backend initialization complete! (Total: {app_elapsed:.2f}s)\n")
+# Graph state response cache (read-heavy, write-rare)
+# meeting_id -> (etag, serialized body)
+graph_state_cache: dict[str, tuple[str, bytes]] = {}
+GRAPH_STATE_CACHE_MAX = 256
+
+
+async def graph_etag(meeting_id: str) -> str:
+    """ETag for the current state of a meeting's graph.
+    
+    Derived from the database (node count + latest last_updated) rather than
+    a per-process counter, so every worker agrees on it and writes made by
+    another worker invalidate this one's cached body too.
+    """
+    version = await db.get_graph_version(meeting_id)
+    digest = hashlib.blake2b(f"{meeting_id}:{version}".encode(), digest_size=8).hexdigest()
+    return f'W/"{digest}"'
+
+
+def invalidate_graph_state(meeting_id: str):
+    """Drop a meeting's cached graph response after a local write"""
+    graph_state_cache.pop(meeting_id, None)
 
 
 @app.get("/")
@@ -399,51 +462,53 @@ async def root():
 
 @app.get("/health")
 async def health():
-    """Health check endpoint - includes database status"""
-    try:
-        db_health = await db.health_check()
-        return {
-            "status": "healthy",
-            "database": db_health
-        }
-    except Exception as e:
-        return {
-            "status": "healthy",
-            "database": {"status": "error", "error": str(e)}
-        }
+    """Health check endpoint - includes database status (cached, at most HEALTH_REFRESH_SECONDS old)"""
+    return {
+        "status": "healthy",
+        "database": health_state
+    }
 
 
 @app.get("/api/db/test")
 async def test_database():
     """Test database connection and basic operations"""
     try:
-        # Check connection
-        health = await db.health_check()
-        if health.get("status") != "connected":
-            return JSONResponse(
+        if not db.pool:
+            return ORJSONResponse(
                 status_code=503,
-                content={"status": "error", "message": "Database not connected", "health": health}
+                content={"status": "error", "message": "Database not connected", "health": await db.health_check()}
             )
         
-        # Test query: Get table count
-        table_count = await db.fetchval("""
-            SELECT COUNT(*) 
-            FROM information_schema.tables 
-            WHERE table_schema = 'public'
-        """)
-        
-        # Test query: Get graph_nodes count
-        node_count = await db.fetchval("SELECT COUNT(*) FROM graph_nodes")
+        # Every probe runs on one borrowed connection
+        async with db.acquire() as connection:
+            # Check connection
+            health = await db.health_check(connection)
+            if health.get("status") != "connected":
+                return ORJSONResponse(
+                    status_code=503,
+                    content={"status": "error", "message": "Database not connected", "health": health}
+                )
+            
+            # Test query: table count and graph_nodes count in one round-trip
+            counts = await connection.fetchrow("""
+                SELECT
+                    (SELECT COUNT(*) FROM pg_class
+                     WHERE relnamespace = 'public'::regnamespace AND relkind IN ('r', 'p')) AS tables,
+                    (SELECT COUNT(*) FROM graph_nodes) AS nodes
+            """)
         
         return {
             "status": "success",
             "message": "Database connection working",
             "database": health.get("database"),
-            "tables": table_count,
-            "nodes": node_count
+            "tables": counts["tables"],
+            "nodes": counts["nodes"],
+            "pool": db.pool_stats(),
+            "embedding_cache": meetmap_service.embedding_cache_info(),
+            "chat_answer_cache": {**chat_answer_stats, "size": len(chat_answer_cache)}
         }
     except Exception as e:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={"status": "error", "message": str(e)}
         )
@@ -468,33 +533,25 @@ async def create_meeting(request: MeetingCreateRequest):
     try:
         # Validate user_id
         if not request.user_id or not request.user_id.strip():
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=400,
                 content={"status": "error", "message": "user_id is required"}
             )
         
         user_id = request.user_id.strip()
         
-        # Create or get user (ensures user exists)
-        await db.create_or_get_user(user_id)
-        
         # Generate meeting ID
-        import uuid
         meeting_id = f"meeting_{uuid.uuid4().hex[:12]}"
         
-        # Create meeting in database (with default title)
-        await db.create_meeting(
+        # Ensure the user exists, create the meeting (with default title) and
+        # link them in one transaction; returns the created meeting
+        meeting = await db.bootstrap_meeting(
+            user_id=user_id,
             meeting_id=meeting_id,
             title="Untitled Meeting",
             description=None
         )
         
-        # Link user to meeting
-        await db.link_user_to_meeting(user_id, meeting_id)
-        
-        # Get the created meeting
-        meeting = await db.get_meeting(meeting_id)
-        
         return {
             "status": "success",
             "meeting": {
@@ -505,32 +562,47 @@ async def create_meeting(request: MeetingCreateRequest):
             }
         }
     except Exception as e:
-        print(f"[ERROR] Error creating meeting: {e}")
-        import traceback
-        traceback.print_exc()
-        return JSONResponse(
+        logger.exception("[ERROR] Error creating meeting: %s", e)
+        return ORJSONResponse(
             status_code=500,
             content={"status": "error", "message": f"Failed to create meeting: {str(e)}"}
         )
 
 
+async def save_transcription_chunk(meeting_id: str, transcription: str):
+    """
+    Append a transcribed chunk to the meeting's transcription (background task)
+    Each chunk is its own transcription_chunks row; reads join them in order
+    """
+    try:
+        await db.save_transcription(meeting_id, transcription)
+        chat_context_cache.pop(meeting_id, None)
+        logger.info("💾 Transcription saved to database for meeting: %s", meeting_id)
+    except Exception as save_error:
+        logger.warning("⚠️ Warning: Failed to save transcription to database: %s", save_error)
+
+
 @app.post("/api/transcribe")
-async def transcribe_audio(request: TranscribeRequest):
+async def transcribe_audio(request: TranscribeRequest, background_tasks: BackgroundTasks):
     """
     Transcribe audio using Whisper API.
     Returns only the transcription text.
     To extract nodes from the transcription, call /api/transcript separately.
     """
+    # Only this endpoint needs these - keep them out of the startup import graph
+    import base64
+    import io
+    
     try:
         # Validate inputs
         if not request.audio or not request.audio.strip():
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=400,
                 content={"status": "error", "message": "audio is required and cannot be empty"}
             )
         
         if not request.meeting_id or not request.meeting_id.strip():
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=400,
                 content={"status": "error", "message": "meeting_id is required"}
             )
@@ -543,7 +615,7 @@ async def transcribe_audio(request: TranscribeRequest):
         # Verify meeting exists
         meeting = await db.get_meeting(meeting_id)
         if not meeting:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=404,
                 content={"status": "error", "message": f"Meeting {meeting_id} not found"}
             )
@@ -554,79 +626,60 @@ async def transcribe_audio(request: TranscribeRequest):
             if "," in audio_base64:
                 audio_base64 = audio_base64.split(",", 1)[1]
             
-            audio_bytes = base64.b64decode(audio_base64)
+            # Multi-MB payloads - decode off the event loop
+            audio_bytes = await asyncio.to_thread(base64.b64decode, audio_base64)
         except Exception as decode_error:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=400,
                 content={"status": "error", "message": f"Invalid base64 audio: {str(decode_error)}"}
             )
         
-        # Step 2: Create temporary file for Whisper API
-        # Whisper API requires a file, so we'll use a temporary file
-        temp_file_path = None
-        try:
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as temp_file:
-                temp_file.write(audio_bytes)
-                temp_file_path = temp_file.name
-            
-            # Step 3: Call OpenAI Whisper API
-            print(f"[{time.strftime('%H:%M:%S')}] 🎤 Transcribing audio with Whisper (meeting: {meeting_id}, duration: {end - start:.2f}s)...")
-            whisper_start = time.time()
-            
-            with open(temp_file_path, "rb") as audio_file:
-                transcription_response = meetmap_service.client.audio.transcriptions.create(
-                    model="whisper-1",
-                    file=audio_file,
-                    response_format="text"  # Get plain text response
-                )
-            
-            # Extract transcription text (handle both string and object responses)
-            if isinstance(transcription_response, str):
-                transcription = transcription_response.strip()
-            elif hasattr(transcription_response, 'text'):
-                transcription = transcription_response.text.strip()
-            else:
-                transcription = str(transcription_response).strip()
-            
-            whisper_elapsed = time.time() - whisper_start
-            print(f"[{time.strftime('%H:%M:%S')}] ✅ Transcription completed in {whisper_elapsed:.2f}s: {transcription[:50]}...")
-            
-            if not transcription or not transcription.strip():
-                return JSONResponse(
-                    status_code=400,
-                    content={"status": "error", "message": "Transcription is empty"}
-                )
-            
-            # Save transcription to database
-            # If meeting_id is new, creates new row; if exists, concatenates to existing transcription
-            try:
-                await db.save_transcription(meeting_id, transcription.strip())
-                print(f"[{time.strftime('%H:%M:%S')}] 💾 Transcription saved to database for meeting: {meeting_id}")
-            except Exception as save_error:
-                print(f"[{time.strftime('%H:%M:%S')}] ⚠️ Warning: Failed to save transcription to database: {save_error}")
-                # Continue anyway - return transcription even if save fails
-            
-            # Return transcription
-            return {
-                "status": "success",
-                "transcription": transcription.strip(),
-                "start": start,
-                "end": end
-            }
-            
-        finally:
-            # Clean up temporary file
-            if temp_file_path and os.path.exists(temp_file_path):
-                try:
-                    os.unlink(temp_file_path)
-                except Exception as cleanup_error:
-                    print(f"[{time.strftime('%H:%M:%S')}] ⚠️ Failed to cleanup temp file: {cleanup_error}")
+        # Step 2: Call OpenAI Whisper API straight from memory - the SDK only
+        # needs a file-like object with a name (used for format detection)
+        audio_file = io.BytesIO(audio_bytes)
+        audio_file.name = "audio.wav"
+        
+        logger.info("🎤 Transcribing audio with Whisper (meeting: %s, duration: %.2fs)...", meeting_id, end - start)
+        whisper_start = time.time()
+        
+        transcription_response = await meetmap_service.async_client.audio.transcriptions.create(
+            model="whisper-1",
+            file=audio_file,
+            response_format="text"  # Get plain text response
+        )
+        
+        # Extract transcription text (handle both string and object responses)
+        if isinstance(transcription_response, str):
+            transcription = transcription_response.strip()
+        elif hasattr(transcription_response, 'text'):
+            transcription = transcription_response.text.strip()
+        else:
+            transcription = str(transcription_response).strip()
+        
+        whisper_elapsed = time.time() - whisper_start
+        logger.info("✅ Transcription completed in %.2fs: %s...", whisper_elapsed, transcription[:50])
+        
+        if not transcription or not transcription.strip():
+            return ORJSONResponse(
+                status_code=400,
+                content={"status": "error", "message": "Transcription is empty"}
+            )
+        
+        # Save transcription to database after the response is sent - a failed
+        # save was never reported to the client, so it needn't hold the request
+        background_tasks.add_task(save_transcription_chunk, meeting_id, transcription.strip())
+        
+        # Return transcription
+        return {
+            "status": "success",
+            "transcription": transcription.strip(),
+            "start": start,
+            "end": end
+        }
         
     except Exception as e:
-        print(f"[{time.strftime('%H:%M:%S')}] ❌ Error in transcribe_audio: {e}")
-        import traceback
-        traceback.print_exc()
-        return JSONResponse(
+        logger.exception("❌ Error in transcribe_audio: %s", e)
+        return ORJSONResponse(
             status_code=500,
             content={"status": "error", "message": f"Failed to transcribe audio: {str(e)}"}
         )
@@ -638,7 +691,7 @@ async def process_transcript_chunk(chunk: dict):
     try:
         # Validate chunk structure
         if not chunk or not isinstance(chunk, dict):
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=400,
                 content={"status": "error", "message": "Invalid chunk format. Expected a dictionary."}
             )
@@ -648,28 +701,36 @@ async def process_transcript_chunk(chunk: dict):
         # Note: meeting_id is required - nodes are isolated per meeting
         
         # Extract nodes and edges with full context
-        nodes, edges = await meetmap_service.extract_nodes(transcript_chunk)
+        try:
+            if transcript_batcher:
+                nodes, edges = await transcript_batcher.submit(transcript_chunk)
+            else:
+                nodes, edges = await meetmap_service.extract_nodes(transcript_chunk)
+        finally:
+            # Nodes may have been written even if extraction failed part-way
+            if transcript_chunk.meeting_id:
+                invalidate_graph_state(transcript_chunk.meeting_id)
         
-        print(f"✅ Extracted {len(nodes)} node(s) and {len(edges)} edge(s) from chunk")
+        logger.info("✅ Extracted %s node(s) and %s edge(s) from chunk", len(nodes), len(edges))
         
-        return {
+        # Returning a Response directly skips FastAPI's jsonable_encoder walk
+        # over the already-dumped lists
+        return ORJSONResponse(content={
             "status": "success",
-            "nodes": [node.model_dump() for node in nodes],
-            "edges": [edge.model_dump() for edge in edges]
-        }
+            "nodes": NODE_LIST.dump_python(nodes, mode="json"),
+            "edges": EDGE_LIST.dump_python(edges, mode="json")
+        })
         
     except ValueError as e:
         # Pydantic validation errors
-        print(f"❌ Validation error: {e}")
-        return JSONResponse(
+        logger.error("❌ Validation error: %s", e)
+        return ORJSONResponse(
             status_code=400,
             content={"status": "error", "message": f"Invalid chunk data: {str(e)}"}
         )
     except Exception as e:
-        print(f"❌ Error processing chunk: {e}")
-        import traceback
-        traceback.print_exc()
-        return JSONResponse(
+        logger.exception("❌ Error processing chunk: %s", e)
+        return ORJSONResponse(
             status_code=500,
             content={"status": "error", "message": str(e)}
         )
@@ -680,20 +741,22 @@ async def get_downward_path(node_id: str, meeting_id: str = Query(..., descripti
     """Get all paths from node down to its last children"""
     try:
         if not node_id or not node_id.strip():
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=400,
                 content={"status": "error", "message": "node_id is required"}
             )
         graph_manager = meetmap_service.graph_manager
-        result = await graph_manager.get_downward_paths(node_id, meeting_id)
+        # One query per tree level - all on one connection checkout
+        async with db.pinned():
+            result = await graph_manager.get_downward_paths(node_id, meeting_id)
         return {"status": "success", **result}
     except KeyError as e:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=404,
             content={"status": "error", "message": f"Node not found: {node_id}"}
         )
     except Exception as e:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={"status": "error", "message": str(e)}
         )
@@ -704,20 +767,22 @@ async def get_upward_path(node_id: str, meeting_id: str = Query(..., description
     """Get path from node up to root"""
     try:
         if not node_id or not node_id.strip():
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=400,
                 content={"status": "error", "message": "node_id is required"}
             )
         graph_manager = meetmap_service.graph_manager
-        result = await graph_manager.get_path_to_root(node_id, meeting_id)
+        # One lookup per ancestor - all on one connection checkout
+        async with db.pinned():
+            result = await graph_manager.get_path_to_root(node_id, meeting_id)
         return {"status": "success", **result}
     except KeyError as e:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=404,
             content={"status": "error", "message": f"Node not found: {node_id}"}
         )
     except Exception as e:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={"status": "error", "message": str(e)}
         )
@@ -728,7 +793,7 @@ async def get_maturity(node_id: str, meeting_id: str = Query(..., description="M
     """Get maturity score for a node"""
     try:
         if not node_id or not node_id.strip():
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=400,
                 content={"status": "error", "message": "node_id is required"}
             )
@@ -736,12 +801,12 @@ async def get_maturity(node_id: str, meeting_id: str = Query(..., description="M
         result = await graph_manager.calculate_maturity(node_id, meeting_id)
         return {"status": "success", **result}
     except KeyError as e:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=404,
             content={"status": "error", "message": f"Node not found: {node_id}"}
         )
     except Exception as e:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={"status": "error", "message": str(e)}
         )
@@ -752,7 +817,7 @@ async def get_influence(node_id: str, meeting_id: str = Query(..., description="
     """Get influence score for a node"""
     try:
         if not node_id or not node_id.strip():
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=400,
                 content={"status": "error", "message": "node_id is required"}
             )
@@ -760,12 +825,45 @@ async def get_influence(node_id: str, meeting_id: str = Query(..., description="
         result = await graph_manager.calculate_influence(node_id, meeting_id)
         return {"status": "success", **result}
     except KeyError as e:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=404,
             content={"status": "error", "message": f"Node not found: {node_id}"}
         )
     except Exception as e:
-        return JSONResponse(
+        return ORJSONResponse(
+            status_code=500,
+            content={"status": "error", "message": str(e)}
+        )
+
+
+class MetricsRequest(BaseModel):
+    """Request model for batch graph metrics"""
+    node_ids: List[str]
+    meeting_id: str  # Meeting ID (required)
+    metrics: List[str] = ["maturity", "influence"]
+
+
+@app.post("/api/graph/metrics")
+async def get_metrics(request: MetricsRequest):
+    """Get maturity/influence for many nodes in one graph traversal"""
+    try:
+        if not request.meeting_id or not request.meeting_id.strip():
+            return ORJSONResponse(
+                status_code=400,
+                content={"status": "error", "message": "meeting_id is required"}
+            )
+        graph_manager = meetmap_service.graph_manager
+        result = await graph_manager.calculate_many(
+            request.node_ids, request.metrics, request.meeting_id.strip()
+        )
+        return {"status": "success", "metrics": result}
+    except ValueError as e:
+        return ORJSONResponse(
+            status_code=400,
+            content={"status": "error", "message": str(e)}
+        )
+    except Exception as e:
+        return ORJSONResponse(
             status_code=500,
             content={"status": "error", "message": str(e)}
         )
@@ -776,39 +874,37 @@ async def get_node_summary(node_id: str, meeting_id: str = Query(..., descriptio
     """Get conversation summary from root to this node (max 50 words)"""
     try:
         if not node_id or not node_id.strip():
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=400,
                 content={"status": "error", "message": "node_id is required"}
             )
         
         # Skip root nodes
         if node_id.startswith("root") or node_id == "root":
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=400,
                 content={"status": "error", "message": "Summary not available for root nodes"}
             )
         
         graph_manager = meetmap_service.graph_manager
         
-        # Get path from root to this node
-        path_result = await graph_manager.get_path_to_root(node_id, meeting_id)
-        path_node_ids = path_result.get("path", [])
+        # DB reads share one connection checkout (released before the LLM call)
+        async with db.pinned():
+            # Get path from root to this node
+            path_result = await graph_manager.get_path_to_root(node_id, meeting_id)
+            path_node_ids = path_result.get("path", [])
+            
+            # Get all nodes in the path (one query, kept in path order)
+            path_nodes = await graph_manager.get_nodes_bulk(path_node_ids, meeting_id) if path_node_ids else []
         
         if not path_node_ids:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=404,
                 content={"status": "error", "message": f"Path not found for node: {node_id}"}
             )
         
-        # Get all nodes in the path
-        path_nodes = []
-        for path_node_id in path_node_ids:
-            node = await graph_manager.get_node(path_node_id, meeting_id)
-            if node:
-                path_nodes.append(node)
-        
         if not path_nodes:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=404,
                 content={"status": "error", "message": "Nodes in path not found"}
             )
@@ -826,113 +922,139 @@ async def get_node_summary(node_id: str, meeting_id: str = Query(..., descriptio
         }
         
     except Exception as e:
-        print(f"[ERROR] Error generating node summary: {e}")
-        import traceback
-        traceback.print_exc()
-        return JSONResponse(
+        logger.exception("[ERROR] Error generating node summary: %s", e)
+        return ORJSONResponse(
             status_code=500,
             content={"status": "error", "message": str(e)}
         )
 
 
+# Shared by every graph-state edge - only ever serialized, never mutated
+PARENT_CHILD_EDGE_METADATA = {"relationship": "parent_child"}
+
+
 @app.get("/api/graph/state")
-async def get_graph_state(meeting_id: str = Query(..., description="Meeting ID (required)")):
+async def get_graph_state(request: Request, meeting_id: str = Query(..., description="Meeting ID (required)")):
     """Get the complete graph state (all nodes and edges) for a meeting"""
     try:
-        graph_manager = meetmap_service.graph_manager
-        
-        # Get all nodes filtered by meeting_id
-        all_graph_nodes = await graph_manager.get_all_nodes(meeting_id=meeting_id)
-        node_ids = [node.id for node in all_graph_nodes]
-        print(f"[{time.strftime('%H:%M:%S')}] [DEBUG] get_graph_state: Found {len(all_graph_nodes)} nodes for meeting_id={meeting_id}")
-        print(f"[{time.strftime('%H:%M:%S')}] [DEBUG] get_graph_state: Node IDs: {node_ids}")
-        
-        # Convert to frontend format using the service's conversion method
-        from models.schemas import NodeData, EdgeData
+        # ETag probe, snapshot and (rare) root creation share one connection checkout
+        async with db.pinned():
+            # Serve repeat polls from cache / 304 while the graph is unchanged.
+            # The ETag is read before the snapshot, so a write racing the build
+            # only makes the body newer than its tag (next poll refetches).
+            etag = await graph_etag(meeting_id)
+            if request.headers.get("if-none-match") == etag:
+                return Response(status_code=304, headers={"ETag": etag})
+            cached = graph_state_cache.get(meeting_id)
+            if cached and cached[0] == etag:
+                return Response(content=cached[1], media_type="application/json", headers={"ETag": etag})
+            
+            graph_manager = meetmap_service.graph_manager
+            
+            # Root + all nodes as raw Records in a single round-trip (no GraphNode models, no dict copies)
+            rows = await graph_manager.fetch_graph_rows(meeting_id=meeting_id)
+            children_counts = graph_manager.count_children(rows)
+            logger.debug("[DEBUG] get_graph_state: Found %d nodes for meeting_id=%s", len(rows), meeting_id)
+            
+            meeting_root_id = f"root_meeting_{meeting_id}"
+            root = next((row for row in rows if row["id"] == meeting_root_id), None)
+            if root is None:
+                # Root doesn't exist yet - get_root creates it
+                root_node = await graph_manager.get_root(meeting_id=meeting_id)
+                if root_node:
+                    root = {"id": root_node.id, "summary": root_node.summary, "metadata": root_node.metadata}
         
+        # Build the NodeData/EdgeData-shaped payload as plain dicts - this is
+        # a read-only path, so skip the Pydantic validate + model_dump round-trip
         nodes = []
         edges = []
         
         # Include root node (meeting-specific)
-        root = await graph_manager.get_root(meeting_id=meeting_id)
         if root:
-            root_node_data = NodeData(
-                id=root.id,
-                text=root.summary,
-                type="idea",
-                timestamp=0.0,
-                confidence=1.0,
-                metadata={
+            nodes.append({
+                "id": root["id"],
+                "text": root["summary"],
+                "type": "idea",
+                "speaker": None,
+                "topic": None,
+                "topic_id": None,
+                "timestamp": 0.0,
+                "confidence": 1.0,
+                "idea_id": None,
+                "metadata": {
                     "depth": 0,
                     "is_root": True,
-                    **root.metadata
+                    **(root["metadata"] or {})
                 }
-            )
-            nodes.append(root_node_data)
+            })
         
         # Convert all other nodes
-        meeting_root_id = f"root_meeting_{meeting_id}"
-        for graph_node in all_graph_nodes:
+        for row in rows:
+            node_id = row["id"]
+            parent_id = row["parent_id"]
             # Skip root nodes (already added above)
-            if graph_node.id == meeting_root_id:
+            if node_id == meeting_root_id:
                 continue
             
             # Debug: Log parent_id for each node
-            print(f"[{time.strftime('%H:%M:%S')}] [DEBUG] Node {graph_node.id}: parent_id={graph_node.parent_id}, depth={graph_node.depth}")
+            logger.debug("[DEBUG] Node %s: parent_id=%s, depth=%s", node_id, parent_id, row["depth"])
             
-            cluster_id = graph_node.metadata.get("cluster_id")
-            cluster_color = graph_manager.get_cluster_color(cluster_id) if cluster_id is not None else None
+            # Rows are parsed fresh per request, so fill the derived keys into
+            # their metadata in place instead of copying it into a new dict.
+            # setdefault keeps stored keys winning, as the old {..., **metadata} did
+            metadata = row["metadata"] or {}
+            cluster_id = metadata.get("cluster_id")
+            metadata.setdefault("depth", row["depth"])
+            metadata.setdefault("parent_id", parent_id)
+            metadata.setdefault("children_count", children_counts.get(node_id, 0))
+            metadata.setdefault("cluster_id", cluster_id)
+            # cluster_color() is lru_cached, so K clusters cost K lookups; only
+            # consult it when the stored metadata doesn't already carry a color
+            if "cluster_color" not in metadata:
+                metadata["cluster_color"] = cluster_color(cluster_id) if cluster_id is not None else None
             
-            node_data = NodeData(
-                id=graph_node.id,
-                text=graph_node.summary,
-                type="idea",
-                speaker=graph_node.metadata.get("speaker"),
-                timestamp=graph_node.metadata.get("timestamp", 0.0),
-                confidence=1.0,
-                metadata={
-                    "depth": graph_node.depth,
-                    "parent_id": graph_node.parent_id,
-                    "children_count": len(graph_node.children_ids),
-                    "cluster_id": cluster_id,
-                    "cluster_color": cluster_color,
-                    **graph_node.metadata
-                }
-            )
-            nodes.append(node_data)
+            nodes.append({
+                "id": node_id,
+                "text": row["summary"],
+                "type": "idea",
+                "speaker": metadata.get("speaker"),
+                "topic": None,
+                "topic_id": None,
+                "timestamp": float(metadata.get("timestamp", 0.0)),
+                "confidence": 1.0,
+                "idea_id": None,
+                "metadata": metadata
+            })
             
             # Create edge from parent to this node
-            if graph_node.parent_id:
-                # Determine if parent is a root node (meeting-specific)
-                is_root_parent = graph_node.parent_id == meeting_root_id
-                
-                edge = EdgeData(
-                    from_node=graph_node.parent_id,
-                    to_node=graph_node.id,
-                    type="root" if is_root_parent else "extends",
-                    strength=1.0,
-                    metadata={
-                        "relationship": "parent_child"
-                    }
-                )
-                edges.append(edge)
-                print(f"[{time.strftime('%H:%M:%S')}] [DEBUG] Created edge: {graph_node.parent_id} -> {graph_node.id}")
+            if parent_id:
+                edges.append({
+                    "from_node": parent_id,
+                    "to_node": node_id,
+                    # Parent is the meeting root -> "root" edge
+                    "type": "root" if parent_id == meeting_root_id else "extends",
+                    "strength": 1.0,
+                    "metadata": PARENT_CHILD_EDGE_METADATA
+                })
+                logger.debug("[DEBUG] Created edge: %s -> %s", parent_id, node_id)
             else:
-                print(f"[{time.strftime('%H:%M:%S')}] [WARNING] Node {graph_node.id} has no parent_id!")
+                logger.warning("[WARNING] Node %s has no parent_id!", node_id)
         
         result = {
             "status": "success",
-            "nodes": [node.model_dump() for node in nodes],
-            "edges": [edge.model_dump() for edge in edges]
+            "nodes": nodes,
+            "edges": edges
         }
-        print(f"[{time.strftime('%H:%M:%S')}] [DEBUG] get_graph_state: Returning {len(result['nodes'])} nodes, {len(result['edges'])} edges for meeting_id={meeting_id}")
-        return result
+        logger.debug("[DEBUG] get_graph_state: Returning %d nodes, %d edges for meeting_id=%s", len(result['nodes']), len(result['edges']), meeting_id)
+        response = ORJSONResponse(content=result, headers={"ETag": etag})
+        if len(graph_state_cache) >= GRAPH_STATE_CACHE_MAX:
+            graph_state_cache.pop(next(iter(graph_state_cache)))
+        graph_state_cache[meeting_id] = (etag, response.body)
+        return response
         
     except Exception as e:
-        print(f"❌ Error getting graph state: {e}")
-        import traceback
-        traceback.print_exc()
-        return JSONResponse(
+        logger.exception("❌ Error getting graph state: %s", e)
+        return ORJSONResponse(
             status_code=500,
             content={"status": "error", "message": str(e)}
         )
@@ -947,24 +1069,107 @@ class ChatRequest(BaseModel):
     image: Optional[str] = None  # Base64-encoded image (optional)
 
 
+# Chat context cache: meeting_id -> (expires_at, transcription text)
+# Chat bursts reuse the context; /api/transcribe drops the entry when it appends
+chat_context_cache: dict[str, tuple[float, str]] = {}
+CHAT_CONTEXT_TTL = float(os.getenv("CHAT_CONTEXT_TTL", 30))
+CHAT_CONTEXT_CACHE_MAX = 1024
+
+
+async def load_chat_context(meeting_id: str) -> Optional[str]:
+    """
+    Meeting transcription for the chat prompt, cached for CHAT_CONTEXT_TTL seconds
+    
+    Returns:
+        Transcription text ("" if nothing transcribed yet), or None if the meeting doesn't exist
+    """
+    now = time.monotonic()
+    cached = chat_context_cache.get(meeting_id)
+    if cached and cached[0] > now:
+        return cached[1]
+    
+    meeting, transcription_record = await asyncio.gather(
+        db.get_meeting(meeting_id),
+        db.get_transcription(meeting_id)
+    )
+    if not meeting:
+        return None
+    
+    transcription_text = ""
+    if transcription_record and transcription_record.get('transcription'):
+        transcription_text = transcription_record['transcription'].strip()
+    
+    if len(chat_context_cache) >= CHAT_CONTEXT_CACHE_MAX:
+        chat_context_cache.pop(next(iter(chat_context_cache)))
+    chat_context_cache[meeting_id] = (now + CHAT_CONTEXT_TTL, transcription_text)
+    return transcription_text
+
+
+# Chat answer cache: blake2b(system prompt + prompt + image) -> (expires_at, answer)
+# The prompt embeds the transcription, so new transcript text changes the key
+chat_answer_cache: dict[str, tuple[float, str]] = {}
+CHAT_ANSWER_TTL = float(os.getenv("CHAT_ANSWER_TTL", 3600))
+CHAT_ANSWER_CACHE_MAX = 1024
+# key -> in-flight completion, so identical concurrent questions share one LLM call
+chat_answer_inflight: dict[str, asyncio.Task] = {}
+chat_answer_stats = {"hits": 0, "coalesced": 0, "misses": 0}
+
+CHAT_SYSTEM_PROMPT = "You are a helpful meeting assistant. You can receive questions, direct meeting transcriptions, or general requests. Use meeting context if available to help answer, otherwise use your general knowledge. If an image is provided, analyze it in the context of the input. Be concise and to-the-point. Not every input will be a question - handle statements, transcriptions, and questions appropriately."
+
+
+def _store_chat_answer(key: str, task: asyncio.Task):
+    """Done-callback for an in-flight answer: cache it if the call succeeded"""
+    chat_answer_inflight.pop(key, None)
+    if task.cancelled() or task.exception() is not None:
+        return
+    if len(chat_answer_cache) >= CHAT_ANSWER_CACHE_MAX:
+        chat_answer_cache.pop(next(iter(chat_answer_cache)))
+    chat_answer_cache[key] = (time.monotonic() + CHAT_ANSWER_TTL, task.result())
+
+
+async def cached_answer(key: str, factory) -> str:
+    """
+    Answer for key from the cache, an identical in-flight call, or factory()
+    
+    Args:
+        key: Hash of everything sent to the model
+        factory: Zero-argument coroutine function producing the answer
+    """
+    cached = chat_answer_cache.get(key)
+    if cached and cached[0] > time.monotonic():
+        chat_answer_stats["hits"] += 1
+        return cached[1]
+    
+    task = chat_answer_inflight.get(key)
+    if task is None:
+        chat_answer_stats["misses"] += 1
+        task = asyncio.create_task(factory())
+        chat_answer_inflight[key] = task
+        task.add_done_callback(lambda t: _store_chat_answer(key, t))
+    else:
+        chat_answer_stats["coalesced"] += 1
+    # Shielded so one caller disconnecting doesn't cancel the others' answer
+    return await asyncio.shield(task)
+
+
 @app.post("/api/chat/ask")
 async def ask_meeting_assistant(request: ChatRequest):
     """
     AI meeting assistant endpoint.
     Answers questions about the meeting or general knowledge helpful for meetings.
-    Uses the full meeting transcription as context (from transcriptions table).
+    Uses the full meeting transcription as context (from transcription_chunks).
     Supports optional image input for vision-based questions.
     """
     try:
         # Validate inputs
         if not request.question or not request.question.strip():
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=400,
                 content={"status": "error", "message": "question is required and cannot be empty"}
             )
         
         if not request.meeting_id or not request.meeting_id.strip():
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=400,
                 content={"status": "error", "message": "meeting_id is required"}
             )
@@ -972,22 +1177,14 @@ async def ask_meeting_assistant(request: ChatRequest):
         question = request.question.strip()
         meeting_id = request.meeting_id.strip()
         
-        # Verify meeting exists
-        meeting = await db.get_meeting(meeting_id)
-        if not meeting:
-            return JSONResponse(
+        # Verify meeting exists and get its transcription (meeting context)
+        transcription_text = await load_chat_context(meeting_id)
+        if transcription_text is None:
+            return ORJSONResponse(
                 status_code=404,
                 content={"status": "error", "message": f"Meeting {meeting_id} not found"}
             )
         
-        # Get transcription for the meeting (meeting context)
-        transcription_record = await db.get_transcription(meeting_id)
-        
-        # Extract transcription text if available
-        transcription_text = ""
-        if transcription_record and transcription_record.get('transcription'):
-            transcription_text = transcription_record['transcription'].strip()
-        
         # Build prompt - handle both cases: with and without meeting transcription
         if transcription_text:
             prompt = f"""You are a helpful meeting assistant. The user may send you:
@@ -1027,6 +1224,7 @@ Instructions:
         user_content = [{"type": "text", "text": prompt}]
         
         # Add image if provided
+        image_url = None
         if request.image:
             # Handle base64 image - accept with or without data URL prefix
             image_data = request.image.strip()
@@ -1043,22 +1241,28 @@ Instructions:
                 "image_url": {"url": image_url}
             })
         
-        # Call GPT-4o-mini (supports vision)
-        try:
-            response = meetmap_service.client.chat.completions.create(
+        key_hash = hashlib.blake2b(digest_size=16)
+        key_hash.update(CHAT_SYSTEM_PROMPT.encode())
+        key_hash.update(prompt.encode())
+        if image_url:
+            key_hash.update(image_url.encode())
+        
+        async def generate_answer() -> str:
+            # Call GPT-4o-mini (supports vision); shares the service's concurrency
+            # cap, rate limit and 429 retries with the extraction pipeline
+            response = await meetmap_service.chat_completion(
                 model="gpt-4o-mini",
                 messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a helpful meeting assistant. You can receive questions, direct meeting transcriptions, or general requests. Use meeting context if available to help answer, otherwise use your general knowledge. If an image is provided, analyze it in the context of the input. Be concise and to-the-point. Not every input will be a question - handle statements, transcriptions, and questions appropriately."
-                    },
+                    {"role": "system", "content": CHAT_SYSTEM_PROMPT},
                     {"role": "user", "content": user_content}
                 ],
                 temperature=0.7,
                 max_tokens=500
             )
-            
-            answer = response.choices[0].message.content.strip()
+            return response.choices[0].message.content.strip()
+        
+        try:
+            answer = await cached_answer(key_hash.hexdigest(), generate_answer)
             
             return {
                 "status": "success",
@@ -1066,10 +1270,8 @@ Instructions:
             }
             
         except Exception as openai_error:
-            print(f"[ERROR] OpenAI API error: {openai_error}")
-            import traceback
-            traceback.print_exc()
-            return JSONResponse(
+            logger.exception("[ERROR] OpenAI API error: %s", openai_error)
+            return ORJSONResponse(
                 status_code=500,
                 content={
                     "status": "error",
@@ -1078,10 +1280,8 @@ Instructions:
             )
         
     except Exception as e:
-        print(f"[ERROR] Error in ask_meeting_assistant: {e}")
-        import traceback
-        traceback.print_exc()
-        return JSONResponse(
+        logger.exception("[ERROR] Error in ask_meeting_assistant: %s", e)
+        return ORJSONResponse(
             status_code=500,
             content={"status": "error", "message": str(e)}
         )
@@ -1089,4 +1289,20 @@ Instructions:
 
 if __name__ == "__main__":
     port = int(os.getenv("PORT", 8001))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # Always one process: WEB_CONCURRENCY (exported by Heroku) is ignored.
+    # Node IDs come from a per-process counter and the root/header/extract/
+    # answer caches are per process, so a second worker would overwrite the
+    # first one's nodes and serve stale state
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=port,
+        # Both ship with uvicorn[standard]; fall back when a slimmer install
+        # (or Windows, which has no uvloop build) doesn't have them
+        loop="uvloop" if find_spec("uvloop") else "asyncio",
+        http="httptools" if find_spec("httptools") else "h11",
+        log_level=os.getenv("UVICORN_LOG_LEVEL", "warning"),
+        # One synchronous log write per request on the event loop; the graph
+        # poller alone makes that a steady stream. UVICORN_ACCESS_LOG=1 to enable
+        access_log=os.getenv("UVICORN_ACCESS_LOG", "0") == "1",
+    )
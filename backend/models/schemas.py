@@ -2,10 +2,14 @@
 Pydantic models for data structures
 """
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 from typing import Optional, List
 from datetime import datetime
 
+# Models only the offline pipeline services use (topic detection / merging):
+# build their validators on first use instead of at API import
+OFFLINE_MODEL_CONFIG = ConfigDict(defer_build=True)
+
 
 class TranscriptChunk(BaseModel):
     """Transcript chunk with timestamps"""
@@ -19,6 +23,8 @@ class TranscriptChunk(BaseModel):
 
 class TopicData(BaseModel):
     """Topic detection result"""
+    model_config = OFFLINE_MODEL_CONFIG
+    
     topic: str
     start: float
     end: float
@@ -62,8 +68,17 @@ class EdgeData(BaseModel):
     metadata: dict = {}
 
 
+# Built once at import - dumping a whole list goes through pydantic-core in one call
+# instead of a Python-level model_dump() per item
+CHUNK_LIST = TypeAdapter(List[TranscriptChunk])
+NODE_LIST = TypeAdapter(List[NodeData])
+EDGE_LIST = TypeAdapter(List[EdgeData])
+
+
 class MergedData(BaseModel):
     """Merged topic and node data"""
+    model_config = OFFLINE_MODEL_CONFIG
+    
     topics: List[TopicData]
     nodes: List[NodeData]
     edges: List[EdgeData]
@@ -72,6 +87,8 @@ class MergedData(BaseModel):
 
 class PipelineResponse(BaseModel):
     """Complete pipeline response"""
+    model_config = OFFLINE_MODEL_CONFIG
+    
     transcript_chunk: TranscriptChunk
     topics: List[TopicData]
     nodes: List[NodeData]
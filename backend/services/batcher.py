@@ -0,0 +1,87 @@
+"""
+Async Batcher - Micro-batching queue for request coalescing
+Items submitted within a short window are handed to one handler call,
+amortizing per-call overhead across concurrent requests
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
+
+
+class AsyncBatcher:
+    """Collects submitted items into batches of up to max_batch, flushed every flush_ms"""
+    
+    def __init__(
+        self,
+        handler: Callable[[List[Any]], Awaitable[List[Any]]],
+        max_batch: int = 16,
+        flush_ms: float = 50
+    ):
+        """
+        Args:
+            handler: Async callable taking a list of items and returning one
+                result per item (in order). A result that is an Exception is
+                raised to that item's submitter.
+            max_batch: Maximum items per handler call
+            flush_ms: How long to wait for more items after the first arrives
+        """
+        self.handler = handler
+        self.max_batch = max_batch
+        self.flush_ms = flush_ms
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+    
+    async def submit(self, item: Any) -> Any:
+        """Queue an item and wait for its result"""
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+        
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+    
+    async def close(self):
+        """Stop the flush worker"""
+        if self._worker and not self._worker.done():
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+    
+    async def _collect(self) -> List[Tuple[Any, asyncio.Future]]:
+        """Wait for one item, then gather more until the batch is full or the window closes"""
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.flush_ms / 1000
+        
+        while len(batch) < self.max_batch:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+    
+    async def _run(self):
+        """Flush loop"""
+        while True:
+            batch = await self._collect()
+            items = [item for item, _ in batch]
+            
+            try:
+                results = await self.handler(items)
+            except Exception as e:
+                results = [e] * len(batch)
+            
+            for (_, future), result in zip(batch, results):
+                if future.done():  # Submitter went away (e.g. request cancelled)
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
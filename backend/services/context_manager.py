@@ -2,28 +2,81 @@
 Context Manager - Accumulates chunks and nodes for full-context analysis
 """
 
-from typing import List, Dict
-from models.schemas import TranscriptChunk, NodeData, EdgeData
+import hashlib
+import heapq
+from collections import deque
+from typing import Deque, List, Dict, Optional
+from models.schemas import TranscriptChunk, NodeData, EdgeData, CHUNK_LIST, NODE_LIST, EDGE_LIST
+from services.embedding_store import EmbeddingStore
 
 
 class ContextManager:
-    """Manages conversation context: chunks and nodes"""
+    """
+    Manages conversation context: chunks and nodes
+    
+    Not used by the API pipeline (MeetMapService reads context from the graph
+    in Postgres); kept as a standalone helper
+    """
+    
+    # get_full_context window: most recent chunks / nodes handed to the LLM
+    CONTEXT_CHUNK_WINDOW = 64
+    CONTEXT_NODE_WINDOW = 128
     
     def __init__(self):
-        self.chunks_buffer: List[TranscriptChunk] = []
+        # Older chunks fall off the window (only their count is kept)
+        self.chunks_buffer: Deque[TranscriptChunk] = deque(maxlen=self.CONTEXT_CHUNK_WINDOW)
+        self.evicted_chunks = 0
         self.all_nodes: List[NodeData] = []
         self.all_edges: List[EdgeData] = []
         self.idea_counter = 0  # For generating idea_id
+        
+        # Semantic dedup: a node whose embedding is this close to one already
+        # registered is the same fact restated, and isn't added again
+        self.DEDUP_SIMILARITY_THRESHOLD = 0.92
+        # Exact-match fast path: digest of normalized summary -> registered node
+        self._summary_index: Dict[bytes, NodeData] = {}
+        # Registered nodes' embeddings as one float32 matrix, so a dedup
+        # check is a single matrix-vector product
+        self._embeddings = EmbeddingStore()
+        self._nodes_by_id: Dict[str, NodeData] = {}
     
     def add_chunk(self, chunk: TranscriptChunk):
-        """Add chunk to buffer"""
+        """Add chunk to buffer (the oldest falls off once the window is full)"""
+        if len(self.chunks_buffer) == self.chunks_buffer.maxlen:
+            self.evicted_chunks += 1
         self.chunks_buffer.append(chunk)
         print(f"📦 Added chunk to buffer. Total chunks: {len(self.chunks_buffer)}")
     
-    def add_node(self, node: NodeData):
-        """Add node to registry"""
+    def add_node(self, node: NodeData, embedding: Optional[List[float]] = None) -> NodeData:
+        """
+        Add node to registry, unless it duplicates one already there
+        
+        Args:
+            node: Node to register
+            embedding: Node's embedding; enables the semantic (cosine) check
+        
+        Returns:
+            The registered node - the existing one if node was a duplicate
+        """
+        key = self._summary_key(node.text)
+        existing = self._summary_index.get(key)
+        if existing is not None:
+            print(f"♻️ Skipped duplicate node (same summary as {existing.id})")
+            return existing
+        
+        if embedding is not None:
+            matches = self._embeddings.search(embedding, self.DEDUP_SIMILARITY_THRESHOLD, 1)
+            if matches:
+                existing_id, similarity = matches[0]
+                print(f"♻️ Skipped duplicate node (similarity {similarity:.3f} to {existing_id})")
+                return self._nodes_by_id[existing_id]
+        
         self.all_nodes.append(node)
+        self._summary_index[key] = node
+        if embedding is not None and self._embeddings.add(node.id, embedding):
+            self._nodes_by_id[node.id] = node
         print(f"📝 Added node to registry. Total nodes: {len(self.all_nodes)}")
+        return node
     
     def add_edge(self, edge: EdgeData):
         """Add edge to registry"""
@@ -31,11 +84,26 @@ class ContextManager:
         print(f"🔗 Added edge to registry. Total edges: {len(self.all_edges)}")
     
     def get_full_context(self) -> Dict:
-        """Get full context: all chunks + all existing nodes"""
+        """
+        Get the bounded context: recent chunks + most recent nodes (and the
+        edges between them), so prompt size stays flat as the meeting grows
+        """
+        nodes = self.all_nodes
+        if len(nodes) > self.CONTEXT_NODE_WINDOW:
+            # Newest nodes, handed over oldest-first like the uncapped list
+            nodes = sorted(
+                heapq.nlargest(self.CONTEXT_NODE_WINDOW, nodes, key=lambda node: node.timestamp),
+                key=lambda node: node.timestamp
+            )
+            node_ids = {node.id for node in nodes}
+            edges = [edge for edge in self.all_edges if edge.from_node in node_ids and edge.to_node in node_ids]
+        else:
+            edges = self.all_edges
         return {
-            "chunks": [chunk.model_dump() for chunk in self.chunks_buffer],
-            "existing_nodes": [node.model_dump() for node in self.all_nodes],
-            "existing_edges": [edge.model_dump() for edge in self.all_edges]
+            "evicted_chunks": self.evicted_chunks,
+            "chunks": CHUNK_LIST.dump_python(list(self.chunks_buffer)),
+            "existing_nodes": NODE_LIST.dump_python(nodes),
+            "existing_edges": EDGE_LIST.dump_python(edges)
         }
     
     def get_next_idea_id(self) -> str:
@@ -45,8 +113,17 @@ class ContextManager:
     
     def reset(self):
         """Reset context (for new meeting)"""
-        self.chunks_buffer = []
+        self.chunks_buffer = deque(maxlen=self.CONTEXT_CHUNK_WINDOW)
+        self.evicted_chunks = 0
         self.all_nodes = []
         self.all_edges = []
         self.idea_counter = 0
-
+        self._summary_index = {}
+        self._embeddings.clear()
+        self._nodes_by_id = {}
+    
+    @staticmethod
+    def _summary_key(text: str) -> bytes:
+        """Digest of a summary, ignoring case and whitespace differences"""
+        normalized = " ".join(text.lower().split())
+        return hashlib.blake2b(normalized.encode(), digest_size=16).digest()
@@ -0,0 +1,106 @@
+"""
+Embedding Store - Node embeddings as one contiguous float32 matrix
+Rows are unit-normalized on insert, so cosine similarity against every stored
+node is a single matrix-vector product (see services/sim_kernels.py)
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from services.sim_kernels import top_k_above
+
+
+class EmbeddingStore:
+    """node_id -> row of an (N, d) float32 matrix; capacity doubles as it fills"""
+    
+    def __init__(self, capacity: int = 64):
+        """
+        Args:
+            capacity: Initial row capacity (dimension is taken from the first vector)
+        """
+        self._capacity = capacity
+        self._matrix: Optional[np.ndarray] = None
+        self._norms: Optional[np.ndarray] = None
+        self.ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self._rows
+    
+    @property
+    def matrix(self) -> np.ndarray:
+        """Unit-normalized rows in insertion order (a view, not a copy)"""
+        if self._matrix is None:
+            return np.empty((0, 0), dtype=np.float32)
+        return self._matrix[:len(self.ids)]
+    
+    def add(self, node_id: str, vector: Sequence[float]) -> bool:
+        """
+        Store a node's embedding (replacing it if the node is already stored)
+        
+        Returns:
+            False if the vector has zero length and was not stored
+        """
+        vector = np.asarray(vector, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        if norm == 0:
+            return False
+        
+        row = self._rows.get(node_id)
+        if row is None:
+            row = len(self.ids)
+            self._reserve(row + 1, vector.shape[0])
+            self.ids.append(node_id)
+            self._rows[node_id] = row
+        self._matrix[row] = vector / norm
+        self._norms[row] = norm
+        return True
+    
+    def get(self, node_id: str) -> Optional[np.ndarray]:
+        """Original (un-normalized) embedding of a node, or None"""
+        row = self._rows.get(node_id)
+        if row is None:
+            return None
+        return self._matrix[row] * self._norms[row]
+    
+    def search(self, query: Sequence[float], threshold: float, k: int) -> List[Tuple[str, float]]:
+        """
+        Stored nodes most similar to query
+        
+        Returns:
+            Up to k (node_id, cosine similarity) pairs >= threshold, best first
+        """
+        if not self.ids:
+            return []
+        query = np.asarray(query, dtype=np.float32)
+        norm = float(np.linalg.norm(query))
+        if norm == 0:
+            return []
+        indices, scores = top_k_above(self.matrix, query / norm, threshold, k)
+        return [(self.ids[i], float(score)) for i, score in zip(indices, scores)]
+    
+    def clear(self):
+        """Drop every stored embedding"""
+        self._matrix = None
+        self._norms = None
+        self.ids = []
+        self._rows = {}
+    
+    def _reserve(self, rows: int, dim: int):
+        """Make room for at least rows rows of width dim"""
+        if self._matrix is None:
+            capacity = max(self._capacity, rows)
+            self._matrix = np.empty((capacity, dim), dtype=np.float32)
+            self._norms = np.empty(capacity, dtype=np.float32)
+        elif rows > self._matrix.shape[0]:
+            capacity = max(self._matrix.shape[0] * 2, rows)
+            count = len(self.ids)
+            matrix = np.empty((capacity, dim), dtype=np.float32)
+            matrix[:count] = self._matrix[:count]
+            norms = np.empty(capacity, dtype=np.float32)
+            norms[:count] = self._norms[:count]
+            self._matrix, self._norms = matrix, norms
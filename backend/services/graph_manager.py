@@ -4,12 +4,35 @@ Uses PostgreSQL database for persistent storage
 All operations are async and require meeting_id for meeting-based isolation
 """
 
-from typing import Dict, Optional, List, Any
+from typing import Dict, Optional, List, Any, Tuple
+from collections import Counter
+from functools import lru_cache
+import logging
 import time
 import numpy as np
-import json
+import orjson
 from models.schemas import GraphNode
-from services.database import db
+from services.database import db, PGVECTOR_ENABLED
+from services.sim_kernels import top_k_above, quantize_int8, int8_unit_rows, unit_rows, unit_vector
+
+logger = logging.getLogger(__name__)
+
+
+# Color palette for clusters (20 distinct colors)
+CLUSTER_COLORS = (
+    "#FF6B6B", "#4ECDC4", "#45B7D1", "#FFA07A", "#98D8C8",
+    "#F7DC6F", "#BB8FCE", "#85C1E2", "#F8B739", "#52BE80",
+    "#EC7063", "#5DADE2", "#F1948A", "#82E0AA", "#F4D03F",
+    "#AED6F1", "#F9E79F", "#A9DFBF", "#F5B7B1", "#D7BDE2"
+)
+
+
+@lru_cache(maxsize=512)
+def cluster_color(cluster_id: Optional[int]) -> str:
+    """Hex color for a cluster ID (pure function of the ID, so safe to memoize)"""
+    if cluster_id is None:
+        return "#CCCCCC"  # Default gray
+    return CLUSTER_COLORS[cluster_id % len(CLUSTER_COLORS)]
 
 
 class GraphManager:
@@ -24,27 +47,39 @@ class GraphManager:
         
         # TOP_K for global search (will be dynamic based on graph size)
         self.TOP_K_DEFAULT = 5
+        # Global search shortlists on int8 embeddings, then rescores exactly;
+        # the shortlist is this much wider (in score and count) to absorb
+        # quantization error
+        self.QUANTIZED_MARGIN = 0.02
         
         # Color palette for clusters (20 distinct colors)
-        self.CLUSTER_COLORS = [
-            "#FF6B6B", "#4ECDC4", "#45B7D1", "#FFA07A", "#98D8C8",
-            "#F7DC6F", "#BB8FCE", "#85C1E2", "#F8B739", "#52BE80",
-            "#EC7063", "#5DADE2", "#F1948A", "#82E0AA", "#F4D03F",
-            "#AED6F1", "#F9E79F", "#A9DFBF", "#F5B7B1", "#D7BDE2"
-        ]
+        self.CLUSTER_COLORS = CLUSTER_COLORS
         
         # Threshold-based incremental clustering
         # Cluster similarity threshold (lower than placement threshold for broader grouping)
         self.CLUSTER_SIMILARITY_THRESHOLD = 0.65  # Nodes with similarity >= this join same cluster
+        
+        # meeting_id -> root node (roots are created once and never edited;
+        # children_ids is kept current by add_node, dropped by reset)
+        self._root_cache: Dict[str, GraphNode] = {}
+        self.ROOT_CACHE_MAX = 1024
+        # (meeting_id, node_id) -> node from get_node_header, least recently
+        # used evicted first. Placement looks up the same parent/target nodes
+        # several times per chunk; id, parent_id, depth and summary never change
+        # after insert, cluster assignment drops the node whose metadata it
+        # re-stamps, reset drops the meeting
+        self._header_cache: Dict[Tuple[str, str], GraphNode] = {}
+        self.HEADER_CACHE_MAX = 2048
     
     def _record_to_graph_node(self, record) -> GraphNode:
         """Convert database record to GraphNode object"""
         if not record:
             return None
         
-        # Parse JSONB fields
-        embedding = json.loads(record['embedding']) if isinstance(record['embedding'], str) else record['embedding']
-        metadata = json.loads(record['metadata']) if isinstance(record['metadata'], str) else record['metadata']
+        # Parse JSONB fields (embedding is omitted by snapshot queries)
+        embedding = record.get('embedding') or []
+        embedding = orjson.loads(embedding) if isinstance(embedding, str) else embedding
+        metadata = orjson.loads(record['metadata']) if isinstance(record['metadata'], str) else record['metadata']
         
         # Get children from database (parent_id = this node's id)
         # We'll load children_ids when needed, not stored in node
@@ -62,17 +97,16 @@ class GraphManager:
     
     async def _get_children_ids(self, node_id: str, meeting_id: str) -> List[str]:
         """Get children IDs for a node from database"""
-        children = await db.get_children(node_id, meeting_id)
-        return [child['id'] for child in children]
+        return await db.get_child_ids(node_id, meeting_id)
     
     async def _initialize_root(self, meeting_id: str):
         """Create root node in database for a specific meeting"""
         root_id = f"root_meeting_{meeting_id}"
         
         # Check if root already exists
-        existing_root = await db.get_node(root_id, meeting_id)
+        existing_root = await db.get_node_header(root_id, meeting_id)
         if existing_root:
-            print(f"[*] Root node already exists: {root_id} (meeting: {meeting_id})")
+            logger.debug("Root node already exists: %s (meeting: %s)", root_id, meeting_id)
             return
         
         # Create a generic placeholder embedding (zero vector)
@@ -91,7 +125,7 @@ class GraphManager:
             metadata=root_metadata
         )
         
-        print(f"[*] Graph initialized with root node: {root_id} (meeting: {meeting_id})")
+        logger.info("Graph initialized with root node: %s (meeting: %s)", root_id, meeting_id)
     
     async def get_node(self, node_id: str, meeting_id: str) -> Optional[GraphNode]:
         """Get node by ID from database"""
@@ -105,12 +139,44 @@ class GraphManager:
             node.children_ids = await self._get_children_ids(node_id, meeting_id)
         return node
     
+    async def get_node_header(self, node_id: str, meeting_id: str) -> Optional[GraphNode]:
+        """
+        Get node by ID without its embedding (left empty) or children_ids -
+        for checks that only need existence, parent_id, depth or summary
+        (served from the header cache when possible; treat it as read-only)
+        """
+        key = (meeting_id, node_id)
+        node = self._header_cache.pop(key, None)
+        if node is None:
+            node = self._record_to_graph_node(await db.get_node_header(node_id, meeting_id))
+            if node is None:
+                return None
+            if len(self._header_cache) >= self.HEADER_CACHE_MAX:
+                self._header_cache.pop(next(iter(self._header_cache)))
+        # (Re-)inserted last = most recently used
+        self._header_cache[key] = node
+        return node
+    
+    async def get_nodes_bulk(self, node_ids: List[str], meeting_id: str) -> List[GraphNode]:
+        """
+        Get several nodes in a single query, in the order of node_ids
+        Missing ids are skipped; children_ids are not loaded
+        """
+        if not node_ids:
+            return []
+        records = await db.get_nodes_bulk(list(node_ids), meeting_id)
+        nodes_by_id = {record['id']: self._record_to_graph_node(record) for record in records}
+        return [nodes_by_id[node_id] for node_id in node_ids if node_id in nodes_by_id]
+    
     async def get_root(self, meeting_id: str) -> Optional[GraphNode]:
         """Get root node from database for a specific meeting"""
         if meeting_id is None:
             raise ValueError("meeting_id is required")
         
-        meeting_root_id = f"root_meeting_{meeting_id}"
+        cached = self._root_cache.get(meeting_id)
+        if cached is not None:
+            return cached
+        
         record = await db.get_root_node(meeting_id)
         
         if not record:
@@ -122,18 +188,20 @@ class GraphManager:
             node = self._record_to_graph_node(record)
             if node:
                 node.children_ids = await self._get_children_ids(node.id, meeting_id)
+                if len(self._root_cache) >= self.ROOT_CACHE_MAX:
+                    self._root_cache.pop(next(iter(self._root_cache)))
+                self._root_cache[meeting_id] = node
             return node
         return None
     
     async def get_children(self, node_id: str, meeting_id: str) -> List[GraphNode]:
         """Get all children of a node from database"""
         children_records = await db.get_children(node_id, meeting_id)
-        children = []
-        for record in children_records:
-            node = self._record_to_graph_node(record)
-            if node:
-                node.children_ids = await self._get_children_ids(node.id, meeting_id)
-                children.append(node)
+        children = [self._record_to_graph_node(record) for record in children_records]
+        # Grandchildren for all children in one query
+        child_ids = await db.get_child_ids_bulk([child.id for child in children], meeting_id)
+        for child in children:
+            child.children_ids = child_ids[child.id]
         return children
     
     async def add_node(
@@ -156,8 +224,8 @@ class GraphManager:
             meeting_id: Meeting ID (required)
             metadata: Additional data
         """
-        # Verify parent exists
-        parent = await self.get_node(parent_id, meeting_id)
+        # Verify parent exists (only its depth is needed)
+        parent = await self.get_node_header(parent_id, meeting_id)
         if not parent:
             raise ValueError(f"Parent node {parent_id} does not exist for meeting {meeting_id}")
         
@@ -170,44 +238,47 @@ class GraphManager:
             node_metadata['meeting_id'] = meeting_id
         
         # Save node to database
-        import time
-        print(f"[{time.strftime('%H:%M:%S')}] [GRAPH_MANAGER] About to save node: {node_id} for meeting_id={meeting_id}")
+        edge_type = "root" if parent_id.startswith("root") else "extends"
         try:
-            await db.save_node(
-                node_id=node_id,
-                meeting_id=meeting_id,
-                embedding=embedding,
-                summary=summary,
-                parent_id=parent_id,
-                depth=depth,
-                metadata=node_metadata
-            )
-            print(f"[{time.strftime('%H:%M:%S')}] [GRAPH_MANAGER] Successfully called save_node for: {node_id}")
-        except Exception as e:
-            print(f"[{time.strftime('%H:%M:%S')}] [GRAPH_MANAGER ERROR] Failed to save node {node_id}: {e}")
-            import traceback
-            traceback.print_exc()
+            # Node and its parent edge are written together: one connection, one transaction
+            async with db.session() as connection:
+                await db.save_node(
+                    node_id=node_id,
+                    meeting_id=meeting_id,
+                    embedding=embedding,
+                    summary=summary,
+                    parent_id=parent_id,
+                    depth=depth,
+                    metadata=node_metadata,
+                    connection=connection
+                )
+                await db.save_edge(
+                    from_node=parent_id,
+                    to_node=node_id,
+                    meeting_id=meeting_id,
+                    edge_type=edge_type,
+                    strength=1.0,
+                    metadata={"relationship": "parent_child"},
+                    connection=connection
+                )
+        except Exception:
+            logger.exception("Failed to save node %s for meeting_id=%s", node_id, meeting_id)
             raise
         
-        # Create edge in database
-        edge_type = "root" if parent_id.startswith("root") else "extends"
-        await db.save_edge(
-            from_node=parent_id,
-            to_node=node_id,
-            meeting_id=meeting_id,
-            edge_type=edge_type,
-            strength=1.0,
-            metadata={"relationship": "parent_child"}
-        )
+        # Keep the cached root's children in step with the new edge
+        cached_root = self._root_cache.get(meeting_id)
+        if cached_root is not None and cached_root.id == parent_id:
+            cached_root.children_ids.append(node_id)
         
-        print(f"  [*] Added node: {node_id} (depth={depth}, parent={parent_id})")
+        # Lazy %-formatting: nothing is formatted unless DEBUG is enabled
+        logger.debug("Added node: %s (depth=%s, parent=%s)", node_id, depth, parent_id)
         
         # Incrementally assign node to cluster (threshold-based)
         # Don't fail node creation if cluster assignment fails
         try:
             await self._assign_to_cluster(node_id, embedding, meeting_id)
         except Exception as cluster_error:
-            print(f"  [WARNING] Failed to assign node {node_id} to cluster (non-fatal): {cluster_error}")
+            logger.warning("Failed to assign node %s to cluster (non-fatal): %s", node_id, cluster_error)
             # Continue - node is still created successfully
         
         # Create and return GraphNode object
@@ -235,128 +306,75 @@ class GraphManager:
             embedding: Embedding vector of the node
             meeting_id: Meeting ID (required)
         """
-        # Get all clusters for this meeting
-        clusters = await db.get_clusters(meeting_id)
-        
-        if len(clusters) == 0:
-            # Create first cluster
-            cluster_id = await db.get_next_cluster_id(meeting_id)
-            color = self.get_cluster_color(cluster_id)
-            await db.save_cluster(cluster_id, meeting_id, embedding.copy(), color)
-            await db.add_cluster_member(cluster_id, node_id, meeting_id)
-            
-            # Update node metadata
-            node = await self.get_node(node_id, meeting_id)
-            if node:
-                node.metadata["cluster_id"] = cluster_id
-                await db.save_node(
-                    node_id=node_id,
-                    meeting_id=meeting_id,
-                    embedding=node.embedding,
-                    summary=node.summary,
-                    parent_id=node.parent_id,
-                    depth=node.depth,
-                    metadata=node.metadata
-                )
-            
-            print(f"  [*] Created cluster {cluster_id} with node {node_id}")
-            return
-        
         # Find best matching cluster
         best_cluster_id = None
         best_similarity = -1.0
         
-        for cluster_record in clusters:
-            cluster_id = cluster_record['cluster_id']
-            centroid_json = cluster_record['centroid']
-            centroid = json.loads(centroid_json) if isinstance(centroid_json, str) else centroid_json
-            
-            similarity = self.cosine_similarity(embedding, centroid)
-            if similarity > best_similarity:
-                best_similarity = similarity
-                best_cluster_id = cluster_id
-        
-        # Check if similarity meets threshold
-        if best_similarity >= self.CLUSTER_SIMILARITY_THRESHOLD:
-            # Assign to existing cluster
-            cluster_id = best_cluster_id
-            await db.add_cluster_member(cluster_id, node_id, meeting_id)
-            
-            # Update node metadata
-            node = await self.get_node(node_id, meeting_id)
-            if node:
-                node.metadata["cluster_id"] = cluster_id
-                await db.save_node(
-                    node_id=node_id,
-                    meeting_id=meeting_id,
-                    embedding=node.embedding,
-                    summary=node.summary,
-                    parent_id=node.parent_id,
-                    depth=node.depth,
-                    metadata=node.metadata
-                )
-            
-            # Update centroid (running average)
-            await self._update_centroid(cluster_id, embedding, meeting_id)
-            
-            print(f"  [*] Assigned node {node_id} to cluster {cluster_id} (similarity: {best_similarity:.3f})")
+        if PGVECTOR_ENABLED:
+            # Nearest centroid ranked in Postgres - one row back, not every cluster
+            nearest = await db.find_nearest_cluster(meeting_id, embedding)
+            has_clusters = nearest is not None
+            if nearest is not None:
+                best_cluster_id, best_similarity = nearest['cluster_id'], nearest['similarity']
         else:
-            # Create new cluster
-            next_cluster_id = await db.get_next_cluster_id(meeting_id)
-            cluster_id = next_cluster_id
-            color = self.get_cluster_color(cluster_id)
-            await db.save_cluster(cluster_id, meeting_id, embedding.copy(), color)
-            await db.add_cluster_member(cluster_id, node_id, meeting_id)
+            # Get all clusters for this meeting
+            clusters = await db.get_clusters(meeting_id)
+            has_clusters = bool(clusters)
             
-            # Update node metadata
-            node = await self.get_node(node_id, meeting_id)
-            if node:
-                node.metadata["cluster_id"] = cluster_id
-                await db.save_node(
-                    node_id=node_id,
-                    meeting_id=meeting_id,
-                    embedding=node.embedding,
-                    summary=node.summary,
-                    parent_id=node.parent_id,
-                    depth=node.depth,
-                    metadata=node.metadata
-                )
+            if clusters:
+                # Every centroid scored in one matrix-vector product
+                centroids = unit_rows([cluster_record['centroid'] for cluster_record in clusters])
+                indices, scores = top_k_above(centroids, unit_vector(embedding), -np.inf, 1)
+                best_cluster_id = clusters[indices[0]]['cluster_id']
+                best_similarity = float(scores[0])
+        
+        # Join the best cluster if it's close enough, otherwise start a new one
+        joins_existing = best_similarity >= self.CLUSTER_SIMILARITY_THRESHOLD
+        cluster_id = best_cluster_id
+        # Cluster row, membership and the node's cluster_id land together:
+        # one connection checkout, one transaction
+        async with db.session() as connection:
+            if joins_existing:
+                # Update centroid (running average)
+                await self._update_centroid(cluster_id, embedding, meeting_id, connection=connection)
+            else:
+                cluster_id = await db.create_cluster(meeting_id, embedding, CLUSTER_COLORS, connection=connection)
+            await db.add_cluster_member(cluster_id, node_id, meeting_id, connection=connection)
             
-            print(f"  [*] Created new cluster {cluster_id} for node {node_id} (best similarity: {best_similarity:.3f} < {self.CLUSTER_SIMILARITY_THRESHOLD})")
+            # Stamp cluster_id into the node's metadata in place
+            await db.set_node_metadata_field(node_id, meeting_id, "cluster_id", cluster_id, connection=connection)
+        # Committed: the next get_node_header reloads the re-stamped metadata
+        self._header_cache.pop((meeting_id, node_id), None)
+        
+        if joins_existing:
+            logger.debug("Assigned node %s to cluster %s (similarity: %.3f)", node_id, cluster_id, best_similarity)
+        elif not has_clusters:
+            logger.debug("Created cluster %s with node %s", cluster_id, node_id)
+        else:
+            logger.debug(
+                "Created new cluster %s for node %s (best similarity: %.3f < %s)",
+                cluster_id, node_id, best_similarity, self.CLUSTER_SIMILARITY_THRESHOLD
+            )
     
-    async def _update_centroid(self, cluster_id: int, new_embedding: List[float], meeting_id: str):
+    async def _update_centroid(
+        self,
+        cluster_id: int,
+        new_embedding: List[float],
+        meeting_id: str,
+        connection=None
+    ):
         """
         Update cluster centroid using running average
-        New centroid = (old_centroid * (n-1) + new_embedding) / n
+        New centroid = (old_centroid * n + new_embedding) / (n + 1), with n the
+        cluster's stored member_count - computed in Postgres, one UPDATE
         
         Args:
             cluster_id: ID of the cluster to update
             new_embedding: Embedding of the newly added node
             meeting_id: Meeting ID (required)
+            connection: Run on this connection (e.g. inside the caller's transaction)
         """
-        cluster = await db.get_cluster(cluster_id, meeting_id)
-        if not cluster:
-            return
-        
-        # Get current centroid
-        centroid_json = cluster['centroid']
-        old_centroid = json.loads(centroid_json) if isinstance(centroid_json, str) else centroid_json
-        
-        # Get cluster member count
-        members = await db.get_cluster_members(cluster_id, meeting_id)
-        n = len(members)
-        
-        if n == 0:
-            return
-        
-        # Calculate running average
-        old_centroid_np = np.array(old_centroid)
-        new_embedding_np = np.array(new_embedding)
-        new_centroid = (old_centroid_np * (n - 1) + new_embedding_np) / n
-        
-        # Update in database
-        color = cluster.get('color') or self.get_cluster_color(cluster_id)
-        await db.save_cluster(cluster_id, meeting_id, new_centroid.tolist(), color)
+        await db.add_to_centroid(cluster_id, meeting_id, new_embedding, connection=connection)
     
     def get_cluster_color(self, cluster_id: int) -> str:
         """
@@ -368,23 +386,20 @@ class GraphManager:
         Returns:
             Hex color code
         """
-        if cluster_id is None:
-            return "#CCCCCC"  # Default gray
-        return self.CLUSTER_COLORS[cluster_id % len(self.CLUSTER_COLORS)]
+        return cluster_color(cluster_id)
     
     def cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
         """Calculate cosine similarity between two vectors"""
-        vec1_np = np.array(vec1)
-        vec2_np = np.array(vec2)
-        
-        dot_product = np.dot(vec1_np, vec2_np)
-        norm1 = np.linalg.norm(vec1_np)
-        norm2 = np.linalg.norm(vec2_np)
+        # asarray doesn't copy float32 ndarrays; three dot products and one
+        # sqrt instead of two separate np.linalg.norm calls
+        vec1_np = np.asarray(vec1, dtype=np.float32)
+        vec2_np = np.asarray(vec2, dtype=np.float32)
         
-        if norm1 == 0 or norm2 == 0:
+        denominator = np.sqrt(np.dot(vec1_np, vec1_np) * np.dot(vec2_np, vec2_np))
+        if denominator == 0:
             return 0.0
         
-        return float(dot_product / (norm1 * norm2))
+        return float(np.dot(vec1_np, vec2_np) / denominator)
     
     def find_best_match(
         self,
@@ -405,14 +420,10 @@ class GraphManager:
         if not node_embeddings:
             return None, 0.0, False
         
-        best_id = None
-        best_similarity = -1.0
-        
-        for node_id, node_embedding in node_embeddings:
-            similarity = self.cosine_similarity(candidate_embedding, node_embedding)
-            if similarity > best_similarity:
-                best_similarity = similarity
-                best_id = node_id
+        matrix = unit_rows([node_embedding for _, node_embedding in node_embeddings])
+        indices, scores = top_k_above(matrix, unit_vector(candidate_embedding), -np.inf, 1)
+        best_id = node_embeddings[indices[0]][0]
+        best_similarity = float(scores[0])
         
         is_match = best_similarity >= threshold
         return best_id, best_similarity, is_match
@@ -422,15 +433,58 @@ class GraphManager:
         if meeting_id is None:
             raise ValueError("meeting_id is required for database operations")
         
-        records = await db.get_all_nodes(meeting_id)
+        # Rows come from db's per-meeting read cache when fresh
         nodes = []
-        for record in records:
+        for record in await db.get_all_nodes(meeting_id):
             node = self._record_to_graph_node(record)
             if node:
-                node.children_ids = await self._get_children_ids(node.id, meeting_id)
                 nodes.append(node)
+        # Every child of a meeting node is in this rowset, so children_ids
+        # come from its parent_id column instead of one query per node
+        nodes_by_id = {node.id: node for node in nodes}
+        for node in nodes:
+            parent = nodes_by_id.get(node.parent_id) if node.parent_id else None
+            if parent is not None:
+                parent.children_ids.append(node.id)
         return nodes
     
+    async def _load_snapshot(self, meeting_id: str) -> Dict[str, GraphNode]:
+        """Load all nodes of a meeting (no embeddings), keyed by id, children_ids linked from the same rowset"""
+        records = await db.get_graph_snapshot(meeting_id)
+        nodes_by_id = {}
+        for record in records:
+            node = self._record_to_graph_node(record)
+            nodes_by_id[node.id] = node
+        
+        for node in nodes_by_id.values():
+            parent = nodes_by_id.get(node.parent_id) if node.parent_id else None
+            if parent is not None:
+                parent.children_ids.append(node.id)
+        return nodes_by_id
+    
+    @staticmethod
+    def count_children(nodes: List[Any]) -> Counter:
+        """Children per node id, from the parent_id column alone (GraphNodes or snapshot rows)"""
+        return Counter(
+            parent_id for parent_id in (
+                node.parent_id if isinstance(node, GraphNode) else node["parent_id"] for node in nodes
+            ) if parent_id
+        )
+    
+    async def fetch_graph_rows(self, meeting_id: str) -> List[Any]:
+        """
+        Load a meeting's whole graph (root included) as snapshot rows in one query
+        
+        For read-only rendering: the asyncpg Records are handed back as-is, with
+        no GraphNode validation and no per-row dict copy. Rows are indexed by
+        column (row["id"], row["summary"], row["parent_id"], row["depth"]);
+        metadata arrives decoded by the JSONB codec (None if NULL).
+        """
+        if meeting_id is None:
+            raise ValueError("meeting_id is required for database operations")
+        
+        return await db.get_graph_snapshot(meeting_id)
+    
     async def get_all_nodes_except_root(self, meeting_id: str) -> List[GraphNode]:
         """Get all nodes except root from database, filtered by meeting_id"""
         if meeting_id is None:
@@ -458,7 +512,7 @@ class GraphManager:
                 "to_node": record['to_node'],
                 "type": record['edge_type'],
                 "strength": record['strength'],
-                "metadata": json.loads(record['metadata']) if isinstance(record['metadata'], str) else record['metadata']
+                "metadata": orjson.loads(record['metadata']) if isinstance(record['metadata'], str) else record['metadata']
             }
             edges.append(edge)
         return edges
@@ -520,13 +574,8 @@ class GraphManager:
         return result
     
     async def get_node_path(self, node_id: str, meeting_id: str) -> List[str]:
-        """Get path from root to node (for LLM context)"""
-        path = []
-        current = await self.get_node(node_id, meeting_id)
-        while current and current.parent_id:
-            path.insert(0, current.id)
-            current = await self.get_node(current.parent_id, meeting_id)
-        return path
+        """Get path from root to node (for LLM context; the root itself is left out)"""
+        return [row['id'] for row in await db.get_ancestors(node_id, meeting_id) if row['parent_id']]
     
     async def find_globally_similar_nodes(
         self,
@@ -550,22 +599,44 @@ class GraphManager:
         if meeting_id is None:
             raise ValueError("meeting_id is required for database operations")
         
-        all_nodes = await self.get_all_nodes_except_root(meeting_id=meeting_id)
-        if exclude_node_id:
-            all_nodes = [n for n in all_nodes if n.id != exclude_node_id]
-        
-        if not all_nodes:
+        if PGVECTOR_ENABLED:
+            # Top-K computed in Postgres on the HNSW index - no full-graph load
+            records = await db.find_similar_nodes(
+                meeting_id, candidate_embedding, self.TOP_K_DEFAULT, exclude_node_id
+            )
+            return [
+                (record['id'], record['similarity'], self._record_to_graph_node(record))
+                for record in records
+                if not filter_by_threshold or record['similarity'] >= self.SIMILARITY_THRESHOLD
+            ]
+        
+        # Scan the compact int8 embeddings instead of loading every full node
+        records = [
+            record for record in await db.get_quantized_embeddings(meeting_id)
+            if record['id'] != exclude_node_id
+        ]
+        if not records:
             return []
         
         # Dynamic TOP_K: use min of default or available nodes
-        available_count = len(all_nodes)
+        available_count = len(records)
         top_k = min(self.TOP_K_DEFAULT, available_count)
         
-        similarities = []
-        for node in all_nodes:
-            similarity = self.cosine_similarity(candidate_embedding, node.embedding)
-            if not filter_by_threshold or similarity >= self.SIMILARITY_THRESHOLD:
-                similarities.append((node.id, similarity, node))
+        buffers = [record['embedding_i8'] or quantize_int8(record['embedding'])[0] for record in records]
+        query = unit_vector(candidate_embedding)
+        threshold = self.SIMILARITY_THRESHOLD - self.QUANTIZED_MARGIN if filter_by_threshold else -np.inf
+        indices, _ = top_k_above(int8_unit_rows(buffers), query, threshold, top_k * 2)
+        
+        # Rescore the shortlist on full-precision embeddings
+        shortlist = await self.get_nodes_bulk([records[i]['id'] for i in indices], meeting_id)
+        if not shortlist:
+            return []
+        scores = unit_rows([node.embedding for node in shortlist]) @ query
+        similarities = [
+            (node.id, float(similarity), node)
+            for node, similarity in zip(shortlist, scores)
+            if not filter_by_threshold or similarity >= self.SIMILARITY_THRESHOLD
+        ]
         
         # Sort by similarity descending
         similarities.sort(key=lambda x: x[1], reverse=True)
@@ -589,26 +660,25 @@ class GraphManager:
                 "last_children": [node_ids]
             }
         """
-        async def find_leaf_paths(current_id, current_path):
-            current_node = await self.get_node(current_id, meeting_id)
-            if not current_node:
-                return []
-            
-            current_path = current_path + [current_id]
-            
-            # If leaf node (no children), return this path
-            if not current_node.children_ids:
-                return [current_path]
+        all_paths = []
+        # Whole subtree in one recursive query (empty if the node doesn't exist)
+        subtree = await db.get_subtree(node_id, meeting_id)
+        if subtree:
+            children_of: Dict[str, List[str]] = {}
+            for row in subtree:
+                if row['id'] != node_id:
+                    children_of.setdefault(row['parent_id'], []).append(row['id'])
             
-            # Otherwise, continue DFS
-            all_paths = []
-            for child_id in current_node.children_ids:
-                child_paths = await find_leaf_paths(child_id, current_path)
-                all_paths.extend(child_paths)
-            
-            return all_paths
-        
-        all_paths = await find_leaf_paths(node_id, [])
+            # DFS in memory; a path ends at a leaf node (no children)
+            stack = [[node_id]]
+            while stack:
+                path = stack.pop()
+                child_ids = children_of.get(path[-1])
+                if not child_ids:
+                    all_paths.append(path)
+                    continue
+                for child_id in reversed(child_ids):
+                    stack.append(path + [child_id])
         
         # Get all unique nodes in all paths
         all_nodes = set()
@@ -638,22 +708,109 @@ class GraphManager:
                 "all_nodes": [node_ids]
             }
         """
-        path = []
-        current = await self.get_node(node_id, meeting_id)
-        
-        # Backtrack to root
-        while current:
-            path.insert(0, current.id)
-            if current.parent_id:
-                current = await self.get_node(current.parent_id, meeting_id)
-            else:
-                break
+        # Backtrack to root in one recursive query
+        path = [row['id'] for row in await db.get_ancestors(node_id, meeting_id)]
         
         return {
             "path": path,
             "all_nodes": path
         }
     
+    METRICS = ("maturity", "influence")
+    
+    async def calculate_many(
+        self,
+        node_ids: List[str],
+        metrics: List[str],
+        meeting_id: str
+    ) -> Dict[str, Dict[str, dict]]:
+        """
+        Calculate several metrics for several nodes from one graph load
+        
+        Descendant counts are memoized, so shared subtrees are walked once
+        instead of once per requested node.
+        
+        Args:
+            node_ids: Node IDs to score
+            metrics: Any of METRICS ("maturity", "influence")
+            meeting_id: Meeting ID (required)
+        
+        Returns:
+            {node_id: {metric: result}} - result shapes match
+            calculate_maturity / calculate_influence
+        """
+        if meeting_id is None:
+            raise ValueError("meeting_id is required for database operations")
+        unknown = [m for m in metrics if m not in self.METRICS]
+        if unknown:
+            raise ValueError(f"Unknown metric(s): {', '.join(unknown)}")
+        
+        nodes_by_id = await self._load_snapshot(meeting_id)
+        descendant_counts: Dict[str, int] = {}
+        
+        def count_descendants(start_id: str) -> int:
+            # Iterative post-order so deep graphs don't hit the recursion limit
+            stack = [(start_id, False)]
+            visiting = set()
+            while stack:
+                n_id, expanded = stack.pop()
+                if n_id in descendant_counts:
+                    continue
+                children = nodes_by_id[n_id].children_ids
+                if expanded:
+                    descendant_counts[n_id] = sum(
+                        1 + descendant_counts.get(child_id, 0) for child_id in children
+                    )
+                elif n_id not in visiting:  # guard against parent_id cycles
+                    visiting.add(n_id)
+                    stack.append((n_id, True))
+                    stack.extend((child_id, False) for child_id in children if child_id not in descendant_counts)
+            return descendant_counts[start_id]
+        
+        results = {}
+        for node_id in node_ids:
+            node = nodes_by_id.get(node_id)
+            node_results = {}
+            
+            if "maturity" in metrics:
+                if not node:
+                    node_results["maturity"] = {"score": 0, "breakdown": {}}
+                else:
+                    descendants = count_descendants(node_id)
+                    
+                    # Weighted formula
+                    depth_score = min(node.depth * 10, 50)  # Max 50 points
+                    children_score = min(len(node.children_ids) * 5, 30)  # Max 30 points
+                    descendants_score = min(descendants * 2, 20)  # Max 20 points
+                    
+                    maturity = depth_score + children_score + descendants_score
+                    maturity = min(maturity, 100)  # Cap at 100
+                    
+                    node_results["maturity"] = {
+                        "score": round(maturity, 1),
+                        "breakdown": {
+                            "depth_score": round(depth_score, 1),
+                            "children_score": round(children_score, 1),
+                            "descendants_score": round(descendants_score, 1)
+                        }
+                    }
+            
+            if "influence" in metrics:
+                if not node:
+                    node_results["influence"] = {"score": 0, "direct": 0, "indirect": 0}
+                else:
+                    direct = len(node.children_ids)
+                    indirect = count_descendants(node_id) - direct
+                    node_results["influence"] = {
+                        "score": direct + indirect,
+                        "direct": direct,
+                        "indirect": indirect
+                    }
+            
+            results[node_id] = node_results
+        
+        return results
+    
     async def calculate_maturity(self, node_id: str, meeting_id: str) -> dict:
         """
         Calculate maturity score for a node
@@ -672,38 +829,8 @@ class GraphManager:
                 }
             }
         """
-        node = await self.get_node(node_id, meeting_id)
-        if not node:
-            return {"score": 0, "breakdown": {}}
-        
-        # Count all descendants
-        async def count_descendants(n_id):
-            n = await self.get_node(n_id, meeting_id)
-            if not n:
-                return 0
-            count = len(n.children_ids)
-            for child_id in n.children_ids:
-                count += await count_descendants(child_id)
-            return count
-        
-        descendants = await count_descendants(node_id)
-        
-        # Weighted formula
-        depth_score = min(node.depth * 10, 50)  # Max 50 points
-        children_score = min(len(node.children_ids) * 5, 30)  # Max 30 points
-        descendants_score = min(descendants * 2, 20)  # Max 20 points
-        
-        maturity = depth_score + children_score + descendants_score
-        maturity = min(maturity, 100)  # Cap at 100
-        
-        return {
-            "score": round(maturity, 1),
-            "breakdown": {
-                "depth_score": round(depth_score, 1),
-                "children_score": round(children_score, 1),
-                "descendants_score": round(descendants_score, 1)
-            }
-        }
+        results = await self.calculate_many([node_id], ["maturity"], meeting_id)
+        return results[node_id]["maturity"]
     
     async def calculate_influence(self, node_id: str, meeting_id: str) -> dict:
         """
@@ -720,48 +847,32 @@ class GraphManager:
                 "indirect": int (all descendants)
             }
         """
-        node = await self.get_node(node_id, meeting_id)
-        if not node:
-            return {"score": 0, "direct": 0, "indirect": 0}
-        
-        # Count all descendants (direct + indirect)
-        async def count_all_descendants(n_id):
-            n = await self.get_node(n_id, meeting_id)
-            if not n:
-                return 0
-            total = len(n.children_ids)  # Direct children
-            
-            # Recursively count descendants
-            for child_id in n.children_ids:
-                total += await count_all_descendants(child_id)
-            
-            return total
-        
-        direct = len(node.children_ids)
-        indirect = await count_all_descendants(node_id) - direct
-        total = direct + indirect
-        
-        return {
-            "score": total,
-            "direct": direct,
-            "indirect": indirect
-        }
+        results = await self.calculate_many([node_id], ["influence"], meeting_id)
+        return results[node_id]["influence"]
     
     async def reset(self, meeting_id: Optional[str] = None):
         """Reset graph for a meeting (delete all nodes) - WARNING: This deletes data!"""
         if meeting_id is None:
             raise ValueError("meeting_id is required for database operations")
         
-        # Delete all nodes for meeting (cascade will delete edges and cluster members)
-        await db.execute(
-            "DELETE FROM graph_nodes WHERE meeting_id = $1",
-            meeting_id
-        )
+        # Both deletes in one transaction on one connection - a failure can't
+        # leave clusters pointing at a half-deleted graph
+        async with db.session() as connection:
+            # Delete all nodes for meeting (cascade will delete edges and cluster members)
+            await connection.execute(
+                "DELETE FROM graph_nodes WHERE meeting_id = $1",
+                meeting_id
+            )
+            
+            # Delete clusters for meeting
+            await connection.execute(
+                "DELETE FROM clusters WHERE meeting_id = $1",
+                meeting_id
+            )
         
-        # Delete clusters for meeting
-        await db.execute(
-            "DELETE FROM clusters WHERE meeting_id = $1",
-            meeting_id
-        )
+        self._root_cache.pop(meeting_id, None)
+        for key in [key for key in self._header_cache if key[0] == meeting_id]:
+            del self._header_cache[key]
+        db.invalidate_meeting_cache(meeting_id)
         
-        print(f"[*] Graph reset for meeting: {meeting_id}")
+        logger.info("Graph reset for meeting: %s", meeting_id)
@@ -0,0 +1,45 @@
+"""
+Logging setup
+Records are handed to a queue in the calling thread and written to stdout by a
+background listener thread, so log I/O never blocks the event loop
+"""
+
+import atexit
+import logging
+import os
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+LOG_FORMAT = "[%(asctime)s] %(message)s"
+LOG_DATEFMT = "%H:%M:%S"
+
+_listener: Optional[QueueListener] = None
+
+
+def setup_logging() -> QueueListener:
+    """
+    Route root logging through a QueueHandler (idempotent)
+    Level comes from LOG_LEVEL (default INFO)
+    
+    Returns:
+        The running QueueListener
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+    
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=LOG_DATEFMT))
+    
+    root = logging.getLogger()
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+    
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    # Flush whatever is still queued on interpreter exit
+    atexit.register(_listener.stop)
+    return _listener
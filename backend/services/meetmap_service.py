@@ -8,19 +8,41 @@ Step 4: Node placement
 
 import os
 import time
-from typing import List, Tuple, Any, Optional
-from openai import OpenAI
-import json
+import hashlib
+import logging
+import asyncio
+import random
+from importlib.util import find_spec
+from collections import OrderedDict
+from typing import List, Tuple, Any, Optional, Union
+import httpx
+from openai import AsyncOpenAI, RateLimitError
+import orjson
 from sentence_transformers import SentenceTransformer
-from models.schemas import TranscriptChunk, NodeData, EdgeData
+from models.schemas import TranscriptChunk, NodeData, EdgeData, NODE_LIST, EDGE_LIST
 from services.graph_manager import GraphManager
+from services.batcher import AsyncBatcher
+
+logger = logging.getLogger(__name__)
+
+# Attempts per LLM call when the API answers 429
+LLM_MAX_ATTEMPTS = 3
+# Embedding micro-batches: texts from concurrent callers arriving within
+# EMBED_FLUSH_MS share one model call of up to EMBED_BATCH_MAX texts
+EMBED_BATCH_MAX = 256
+EMBED_FLUSH_MS = 20
+# Idea-extraction model (also part of the extract_nodes memo key)
+EXTRACTION_MODEL = "gpt-4o-mini"
+# Memoized extract_nodes results: a re-sent transcript segment (overlapping STT
+# windows, client retries) gets back the nodes it produced the first time
+EXTRACT_CACHE_MAX = int(os.getenv("EXTRACT_CACHE_SIZE", 4096))
 
 class MeetMapService:
     """Service for building semantic idea-evolution graph"""
     
     def __init__(self):
         service_start = time.time()
-        print(f"\n[{time.strftime('%H:%M:%S')}] 🚀 Initializing MeetMapService...")
+        logger.info("🚀 Initializing MeetMapService...")
         
         # Initialize OpenAI client
         client_start = time.time()
@@ -30,9 +52,30 @@ class MeetMapService:
                 "OPENAI_API_KEY environment variable is required. "
                 "Please set it in your .env file or environment variables."
             )
-        self.client = OpenAI(api_key=api_key)
+        # Native async client for every LLM call (no thread hop, no loop blocking).
+        # One pooled connection set shared by extraction, placement, /api/chat/ask
+        # and transcription keeps TLS sessions warm between calls; HTTP/2 lets
+        # concurrent calls multiplex over one connection when h2 is installed.
+        self.async_client = AsyncOpenAI(
+            api_key=api_key,
+            http_client=httpx.AsyncClient(
+                http2=find_spec("h2") is not None,
+                limits=httpx.Limits(
+                    max_connections=int(os.getenv("LLM_MAX_CONNECTIONS", 100)),
+                    max_keepalive_connections=20,
+                    keepalive_expiry=60
+                )
+            )
+        )
         client_elapsed = time.time() - client_start
-        print(f"[{time.strftime('%H:%M:%S')}] ✅ OpenAI client initialized ({client_elapsed:.3f}s)")
+        logger.info("✅ OpenAI client initialized (%.3fs)", client_elapsed)
+        
+        # Bound outbound LLM traffic: at most LLM_MAX_INFLIGHT concurrent calls,
+        # started no faster than LLM_MAX_RPS per second
+        self._llm_semaphore = asyncio.Semaphore(int(os.getenv("LLM_MAX_INFLIGHT", 8)))
+        self._llm_min_interval = 1.0 / float(os.getenv("LLM_MAX_RPS", 5))
+        self._llm_rate_lock = asyncio.Lock()
+        self._llm_next_slot = 0.0
         
         self.node_counter = 0
         self.root_sent = False  # Track if root node has been sent to frontend
@@ -41,19 +84,237 @@ class MeetMapService:
         graph_start = time.time()
         self.graph_manager = GraphManager()
         graph_elapsed = time.time() - graph_start
-        print(f"[{time.strftime('%H:%M:%S')}] ✅ GraphManager initialized ({graph_elapsed:.3f}s)")
+        logger.info("✅ GraphManager initialized (%.3fs)", graph_elapsed)
         
         # Load embedding model at startup (required for constant embedding generation)
         model_start = time.time()
-        print(f"[{time.strftime('%H:%M:%S')}] 📦 Loading embedding model 'all-MiniLM-L6-v2'...")
+        logger.info("📦 Loading embedding model 'all-MiniLM-L6-v2'...")
         self.embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
         model_elapsed = time.time() - model_start
-        print(f"[{time.strftime('%H:%M:%S')}] ✅ Embedding model loaded ({model_elapsed:.2f}s)")
+        logger.info("✅ Embedding model loaded (%.2fs)", model_elapsed)
+        
+        # Memoize embeddings by exact idea text (LRU) - repeated phrasings skip the model
+        # Tuples so cached vectors can't be mutated by callers
+        self._embedding_cache: "OrderedDict[str, Tuple[float, ...]]" = OrderedDict()
+        self._embedding_cache_max = int(os.getenv("EMBEDDING_CACHE_SIZE", 4096))
+        self._embedding_cache_hits = 0
+        self._embedding_cache_misses = 0
+        self._embed_batcher = AsyncBatcher(
+            self._encode_batch,
+            max_batch=EMBED_BATCH_MAX,
+            flush_ms=EMBED_FLUSH_MS
+        )
+        
+        # chunk key -> dumped (nodes, edges); key -> in-flight pipeline run, so
+        # identical concurrent chunks share one run
+        self._extract_cache: dict = {}
+        self._extract_inflight: dict = {}
         
         service_elapsed = time.time() - service_start
-        print(f"[{time.strftime('%H:%M:%S')}] 🎉 MeetMapService ready! (Total: {service_elapsed:.2f}s)\n")
+        logger.info("🎉 MeetMapService ready! (Total: %.2fs)", service_elapsed)
+    
+    @classmethod
+    async def create(cls) -> "MeetMapService":
+        """
+        Build the service in a worker thread - loading the embedding model is
+        blocking disk/CPU work, so the event loop stays free for other startup
+        steps (e.g. DB connect) meanwhile
+        """
+        return await asyncio.to_thread(cls)
+    
+    async def _wait_for_rate_slot(self):
+        """Space out LLM call starts by the configured minimum interval"""
+        async with self._llm_rate_lock:
+            now = time.monotonic()
+            delay = self._llm_next_slot - now
+            self._llm_next_slot = max(now, self._llm_next_slot) + self._llm_min_interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+    
+    async def chat_completion(self, **kwargs):
+        """
+        Run a chat completion under the concurrency cap and rate limit
+        Retries on 429 with randomized exponential backoff (1s..30s)
+        
+        Args:
+            **kwargs: Passed through to async_client.chat.completions.create
+            
+        Returns:
+            The completion response
+        """
+        for attempt in range(LLM_MAX_ATTEMPTS):
+            async with self._llm_semaphore:
+                await self._wait_for_rate_slot()
+                try:
+                    return await self.async_client.chat.completions.create(**kwargs)
+                except RateLimitError:
+                    if attempt == LLM_MAX_ATTEMPTS - 1:
+                        raise
+            backoff = min(30.0, max(1.0, random.uniform(0, 2 ** (attempt + 1))))
+            logger.info("[LLM] Rate limited, retrying in %.1fs (attempt %s/%s)", backoff, attempt + 1, LLM_MAX_ATTEMPTS)
+            await asyncio.sleep(backoff)
+    
+    def _encode(self, texts: List[str]) -> List[Tuple[float, ...]]:
+        """Run the embedding model over texts in one batched call (blocking, unit-length output)"""
+        # all-MiniLM-L6-v2 already ends in a Normalize layer; asking for it
+        # explicitly keeps stored embeddings unit-length for any model
+        vectors = self.embedding_model.encode(texts, batch_size=EMBED_BATCH_MAX, normalize_embeddings=True)
+        return [tuple(vector.tolist()) for vector in vectors]
+    
+    async def _encode_batch(self, texts: List[str]) -> List[Tuple[float, ...]]:
+        """AsyncBatcher handler - encode in a worker thread so the event loop keeps serving"""
+        return await asyncio.to_thread(self._encode, texts)
+    
+    def _cached_lookup(self, texts: List[str]) -> Tuple[dict, List[str]]:
+        """Split texts into (cached vectors by text, distinct texts still to encode)"""
+        cache = self._embedding_cache
+        known = {text: cache[text] for text in dict.fromkeys(texts) if text in cache}
+        missing = [text for text in dict.fromkeys(texts) if text not in known]
+        self._embedding_cache_hits += len(texts) - len(missing)
+        self._embedding_cache_misses += len(missing)
+        return known, missing
+    
+    def _remember(self, texts: List[str], vectors: dict) -> List[List[float]]:
+        """Store/refresh vectors in the LRU cache and return them in texts order"""
+        cache = self._embedding_cache
+        for text in dict.fromkeys(texts):
+            cache[text] = vectors[text]
+            cache.move_to_end(text)
+        while len(cache) > self._embedding_cache_max:
+            cache.popitem(last=False)
+        return [list(vectors[text]) for text in texts]
+    
+    def embed_many(self, texts: List[str]) -> List[List[float]]:
+        """
+        Get embeddings for several texts
+        Cache misses are encoded together in a single batched model call
+        """
+        known, missing = self._cached_lookup(texts)
+        if missing:
+            known.update(zip(missing, self._encode(missing)))
+        return self._remember(texts, known)
+    
+    async def embed_many_async(self, texts: List[str]) -> List[List[float]]:
+        """
+        Get embeddings for several texts without blocking the event loop
+        Cache misses from all concurrent callers are coalesced into shared
+        batched model calls that run in a worker thread
+        """
+        known, missing = self._cached_lookup(texts)
+        if missing:
+            vectors = await asyncio.gather(*[self._embed_batcher.submit(text) for text in missing])
+            known.update(zip(missing, vectors))
+        return self._remember(texts, known)
+    
+    def embed(self, text: str) -> List[float]:
+        """Get embedding for text, served from the in-process cache when seen before"""
+        return self.embed_many([text])[0]
+    
+    async def close_embedder(self):
+        """Stop the embedding batch worker (shutdown)"""
+        await self._embed_batcher.close()
     
-    async def extract_nodes(self, chunk: TranscriptChunk) -> Tuple[List[NodeData], List[EdgeData]]:
+    def embedding_cache_info(self) -> dict:
+        """Embedding cache statistics (hits, misses, size)"""
+        return {
+            "hits": self._embedding_cache_hits,
+            "misses": self._embedding_cache_misses,
+            "size": len(self._embedding_cache),
+            "maxsize": self._embedding_cache_max
+        }
+    
+    async def extract_nodes_batch(
+        self,
+        chunks: List[TranscriptChunk]
+    ) -> List[Union[Tuple[List[NodeData], List[EdgeData]], Exception]]:
+        """
+        Process a batch of transcript chunks (see services/batcher.py)
+        
+        Chunks of the same meeting run in arrival order, since each placement
+        depends on the nodes created before it; different meetings run
+        concurrently.
+        
+        Returns: one (nodes, edges) tuple - or the raised Exception - per chunk
+        """
+        results: List[Any] = [None] * len(chunks)
+        indices_by_meeting: dict = {}
+        for idx, chunk in enumerate(chunks):
+            indices_by_meeting.setdefault(chunk.meeting_id, []).append(idx)
+        
+        async def run_chunk(idx: int, ideas: Optional[List[str]]):
+            try:
+                results[idx] = await self.extract_nodes(chunks[idx], idea_descriptions=ideas)
+            except Exception as e:
+                results[idx] = e
+        
+        # Round r takes the r-th chunk of every meeting: those are independent,
+        # so their idea extraction shares one LLM call. Placement still runs
+        # per chunk, and round r+1 sees round r's nodes as context.
+        rounds = max(len(indices) for indices in indices_by_meeting.values())
+        for r in range(rounds):
+            heads = [indices[r] for indices in indices_by_meeting.values() if r < len(indices)]
+            # Already-processed chunks are answered from the memo, not re-extracted
+            fresh = [idx for idx in heads if self._extract_key(chunks[idx]) not in self._extract_cache]
+            ideas_by_idx = {}
+            if len(fresh) > 1:
+                ideas_per_chunk = await self._extract_ideas_batch([chunks[idx] for idx in fresh])
+                ideas_by_idx = dict(zip(fresh, ideas_per_chunk))
+            await asyncio.gather(*[run_chunk(idx, ideas_by_idx.get(idx)) for idx in heads])
+        return results
+    
+    @staticmethod
+    def _extract_key(chunk: TranscriptChunk) -> bytes:
+        """Memo key: meeting + extraction model + text (ignoring case and whitespace)"""
+        normalized = " ".join(chunk.text.lower().split())
+        key = f"{chunk.meeting_id}|{EXTRACTION_MODEL}|{normalized}"
+        return hashlib.blake2b(key.encode(), digest_size=16).digest()
+    
+    def _store_extraction(self, key: bytes, task: asyncio.Task):
+        """Done-callback for an in-flight pipeline run: memoize it if it succeeded"""
+        self._extract_inflight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        nodes, edges = task.result()
+        if len(self._extract_cache) >= EXTRACT_CACHE_MAX:
+            self._extract_cache.pop(next(iter(self._extract_cache)))
+        self._extract_cache[key] = (NODE_LIST.dump_python(nodes), EDGE_LIST.dump_python(edges))
+    
+    async def extract_nodes(
+        self,
+        chunk: TranscriptChunk,
+        idea_descriptions: Optional[List[str]] = None
+    ) -> Tuple[List[NodeData], List[EdgeData]]:
+        """
+        Process a transcript chunk, or return the nodes it already produced
+        if the same text was processed for this meeting before
+        
+        Args:
+            chunk: Transcript chunk
+            idea_descriptions: Ideas already extracted for this chunk (by
+                extract_nodes_batch); skips step 1 when given
+        
+        Returns: (nodes, edges) in frontend-compatible format
+        """
+        key = self._extract_key(chunk)
+        cached = self._extract_cache.get(key)
+        if cached is not None:
+            logger.info("♻️ Chunk already processed - returning memoized nodes: %s...", chunk.text[:50])
+            return NODE_LIST.validate_python(cached[0]), EDGE_LIST.validate_python(cached[1])
+        
+        task = self._extract_inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._run_pipeline(chunk, idea_descriptions))
+            self._extract_inflight[key] = task
+            task.add_done_callback(lambda t: self._store_extraction(key, t))
+        # Shielded so one caller going away doesn't cancel the shared run
+        nodes, edges = await asyncio.shield(task)
+        return list(nodes), list(edges)
+    
+    async def _run_pipeline(
+        self,
+        chunk: TranscriptChunk,
+        idea_descriptions: Optional[List[str]] = None
+    ) -> Tuple[List[NodeData], List[EdgeData]]:
         """
         Process a transcript chunk through the pipeline:
         1. Extract ideas (GPT only)
@@ -61,42 +322,50 @@ class MeetMapService:
         3. Global search + LLM placement
         4. Convert to frontend format
         
+        Args:
+            chunk: Transcript chunk
+            idea_descriptions: Ideas already extracted for this chunk (by
+                extract_nodes_batch); skips step 1 when given
+        
         Returns: (nodes, edges) in frontend-compatible format
         """
         pipeline_start = time.time()
-        print(f"\n[{time.strftime('%H:%M:%S')}] 📥 Processing chunk: {chunk.text[:50]}...")
+        logger.info("📥 Processing chunk: %s...", chunk.text[:50])
         
         # Step 1: Extract ideas using GPT (only role of GPT)
         step1_start = time.time()
-        print(f"[{time.strftime('%H:%M:%S')}] STEP 1: Starting GPT idea extraction...")
-        idea_descriptions = await self._extract_ideas(chunk)
+        if idea_descriptions is None:
+            logger.info("STEP 1: Starting GPT idea extraction...")
+            idea_descriptions = await self._extract_ideas(chunk)
+        else:
+            logger.info("STEP 1: Using ideas from batched extraction")
         step1_elapsed = time.time() - step1_start
-        print(f"[{time.strftime('%H:%M:%S')}] STEP 1: Completed in {step1_elapsed:.2f}s - Extracted {len(idea_descriptions)} idea(s)")
+        logger.info("STEP 1: Completed in %.2fs - Extracted %s idea(s)", step1_elapsed, len(idea_descriptions))
         
         if not idea_descriptions:
-            print(f"[{time.strftime('%H:%M:%S')}] ⚠️ No ideas extracted from chunk")
+            logger.warning("⚠️ No ideas extracted from chunk")
             return [], []
         
         # Step 2: Generate embeddings for each idea
         # Step 3: Global search + LLM placement
         step2_start = time.time()
-        print(f"[{time.strftime('%H:%M:%S')}] STEP 2-3: Starting embedding generation and node placement for {len(idea_descriptions)} idea(s)...")
+        logger.info("STEP 2-3: Starting embedding generation and node placement for %s idea(s)...", len(idea_descriptions))
         new_graph_nodes = []
         
-        for idx, idea_text in enumerate(idea_descriptions, 1):
+        # Generate embeddings for all ideas (batched with other in-flight chunks)
+        embed_start = time.time()
+        logger.info("  Generating embeddings for %s idea(s)...", len(idea_descriptions))
+        idea_embeddings = await self.embed_many_async(idea_descriptions)
+        embed_elapsed = time.time() - embed_start
+        logger.info("  Embeddings generated in %.2fs (embedding dim: %s)", embed_elapsed, len(idea_embeddings[0]))
+        
+        for idx, (idea_text, embedding) in enumerate(zip(idea_descriptions, idea_embeddings), 1):
             idea_start = time.time()
-            print(f"[{time.strftime('%H:%M:%S')}]   Processing idea {idx}/{len(idea_descriptions)}: {idea_text[:50]}...")
-            
-            # Generate embedding
-            embed_start = time.time()
-            print(f"[{time.strftime('%H:%M:%S')}]     Generating embedding...")
-            embedding = self.embedding_model.encode(idea_text).tolist()
-            embed_elapsed = time.time() - embed_start
-            print(f"[{time.strftime('%H:%M:%S')}]     Embedding generated in {embed_elapsed:.2f}s (embedding dim: {len(embedding)})")
+            logger.info("  Processing idea %s/%s: %s...", idx, len(idea_descriptions), idea_text[:50])
             
             # Global search for similar nodes (filtered by meeting_id)
             search_start = time.time()
-            print(f"[{time.strftime('%H:%M:%S')}]     Searching for similar nodes in graph...")
+            logger.info("    Searching for similar nodes in graph...")
             meeting_id_for_search = chunk.meeting_id if chunk.meeting_id else None
             if not meeting_id_for_search:
                 raise ValueError("meeting_id is required for similarity search")
@@ -107,18 +376,18 @@ class MeetMapService:
                 meeting_id=meeting_id_for_search  # Filter by meeting_id
             )
             search_elapsed = time.time() - search_start
-            print(f"[{time.strftime('%H:%M:%S')}]     Global search completed in {search_elapsed:.3f}s - found {len(similar_nodes)} similar node(s)")
+            logger.info("    Global search completed in %.3fs - found %s similar node(s)", search_elapsed, len(similar_nodes))
             
             if similar_nodes:
-                print(f"[{time.strftime('%H:%M:%S')}]     Top similar nodes:")
+                logger.debug("    Top similar nodes:")
                 for i, (node_id, sim_score, node) in enumerate(similar_nodes[:5], 1):
-                    print(f"        {i}. '{node.summary[:60]}...' (id: {node_id}, similarity: {sim_score:.3f})")
+                    logger.debug("        %d. '%s...' (id: %s, similarity: %.3f)", i, node.summary[:60], node_id, sim_score)
             
             # LLM decides placement
             llm_start = time.time()
             
             if similar_nodes:
-                print(f"[{time.strftime('%H:%M:%S')}]     Calling LLM for placement decision...")
+                logger.info("    Calling LLM for placement decision...")
                 parent_id = await self.decide_placement(
                     candidate_summary=idea_text,
                     candidate_embedding=embedding,
@@ -127,9 +396,9 @@ class MeetMapService:
                 )
                 # Validate: ensure parent_id is not the node being created (prevent cycles)
                 # Also ensure it's not creating a cycle by checking if parent exists
-                parent_node = await self.graph_manager.get_node(parent_id, meeting_id=chunk.meeting_id)
+                parent_node = await self.graph_manager.get_node_header(parent_id, meeting_id=chunk.meeting_id)
                 if not parent_node:
-                    print(f"[{time.strftime('%H:%M:%S')}]     [WARNING] LLM selected invalid parent {parent_id}, falling back to root")
+                    logger.warning("    [WARNING] LLM selected invalid parent %s, falling back to root", parent_id)
                     parent_id = root_id
             else:
                 # No nodes in graph - place under meeting-specific root
@@ -143,9 +412,9 @@ class MeetMapService:
                     parent_id = meeting_root.id if meeting_root else f"root_meeting_{chunk.meeting_id}"
                 else:
                     raise ValueError("meeting_id is required for node placement")
-                print(f"[{time.strftime('%H:%M:%S')}]     No existing nodes found, placing under root: {parent_id}")
+                logger.info("    No existing nodes found, placing under root: %s", parent_id)
             llm_elapsed = time.time() - llm_start
-            print(f"[{time.strftime('%H:%M:%S')}]     Placement decision completed in {llm_elapsed:.2f}s - placing under {parent_id}")
+            logger.info("    Placement decision completed in %.2fs - placing under %s", llm_elapsed, parent_id)
             
             # Place node in graph
             place_start = time.time()
@@ -174,36 +443,29 @@ class MeetMapService:
                 metadata=node_metadata
             )
             place_elapsed = time.time() - place_start
-            print(f"[{time.strftime('%H:%M:%S')}]     Node placement completed in {place_elapsed:.3f}s")
+            logger.info("    Node placement completed in %.3fs", place_elapsed)
             
             new_graph_nodes.append(graph_node)
             idea_elapsed = time.time() - idea_start
-            print(f"[{time.strftime('%H:%M:%S')}]   ✓ Idea {idx} completed in {idea_elapsed:.2f}s (embed: {embed_elapsed:.2f}s, search: {search_elapsed:.3f}s, llm: {llm_elapsed:.2f}s, place: {place_elapsed:.3f}s)")
+            logger.info("  ✓ Idea %s completed in %.2fs (search: %.3fs, llm: %.2fs, place: %.3fs)", idx, idea_elapsed, search_elapsed, llm_elapsed, place_elapsed)
         
         step2_elapsed = time.time() - step2_start
-        print(f"[{time.strftime('%H:%M:%S')}] STEP 2-3: Completed in {step2_elapsed:.2f}s - Processed {len(new_graph_nodes)} node(s)")
+        logger.info("STEP 2-3: Completed in %.2fs - Processed %s node(s)", step2_elapsed, len(new_graph_nodes))
         
         # Step 5: Convert graph structure to frontend format
         step5_start = time.time()
-        print(f"[{time.strftime('%H:%M:%S')}] STEP 5: Converting to frontend format...")
+        logger.info("STEP 5: Converting to frontend format...")
         nodes, edges = await self._graph_to_frontend_format(new_graph_nodes, meeting_id=chunk.meeting_id)
         step5_elapsed = time.time() - step5_start
-        print(f"[{time.strftime('%H:%M:%S')}] STEP 5: Completed in {step5_elapsed:.3f}s")
+        logger.info("STEP 5: Completed in %.3fs", step5_elapsed)
         
         total_elapsed = time.time() - pipeline_start
-        print(f"[{time.strftime('%H:%M:%S')}] ✅ Pipeline complete: {len(nodes)} node(s), {len(edges)} edge(s) in {total_elapsed:.2f}s total")
-        print(f"[{time.strftime('%H:%M:%S')}]   Breakdown: GPT={step1_elapsed:.2f}s, Embed+Search+LLM={step2_elapsed:.2f}s, Convert={step5_elapsed:.3f}s")
+        logger.info("✅ Pipeline complete: %s node(s), %s edge(s) in %.2fs total", len(nodes), len(edges), total_elapsed)
+        logger.info("  Breakdown: GPT=%.2fs, Embed+Search+LLM=%.2fs, Convert=%.3fs", step1_elapsed, step2_elapsed, step5_elapsed)
         return nodes, edges
     
-    async def _extract_ideas(self, chunk: TranscriptChunk) -> List[str]:
-        """
-        Step 1: Extract idea descriptions from transcript chunk
-        GPT's ONLY role - no graph decisions, no parent selection
-        Includes context from recent chunks' nodes
-        """
-        gpt_start = time.time()
-        print(f"[{time.strftime('%H:%M:%S')}]     Preparing GPT prompt (chunk length: {len(chunk.text)} chars)...")
-        
+    async def _build_extraction_context(self, chunk: TranscriptChunk) -> str:
+        """Summarize the meeting's recent chunk nodes as prompt context for idea extraction"""
         # Get recent chunk nodes for context (most recent 3-5 chunks)
         meeting_id_for_context = chunk.meeting_id if chunk.meeting_id else None
         if not meeting_id_for_context:
@@ -220,10 +482,107 @@ class MeetMapService:
                     context_parts.append(f"\nChunk {chunk_id}:")
                     context_parts.extend(node_descriptions)
             context_str = "\n".join(context_parts)
-            print(f"[{time.strftime('%H:%M:%S')}]     Including context from {len(recent_chunks)} recent chunk(s) with {sum(len(nodes) for _, nodes in recent_chunks)} node(s)")
+            logger.info("    Including context from %s recent chunk(s) with %s node(s)", len(recent_chunks), sum(len(nodes) for _, nodes in recent_chunks))
         else:
             context_str = ""
-            print(f"[{time.strftime('%H:%M:%S')}]     No previous chunks found, starting fresh")
+            logger.info("    No previous chunks found, starting fresh")
+        return context_str
+    
+    @staticmethod
+    def _parse_json_content(content: str) -> Any:
+        """Parse a JSON LLM reply, tolerating a markdown code fence around it"""
+        content = content.strip()
+        if content.startswith("```"):
+            content = content.split("```")[1]
+            if content.startswith("json"):
+                content = content[4:]
+        return orjson.loads(content)
+    
+    async def _extract_ideas_batch(self, chunks: List[TranscriptChunk]) -> List[Optional[List[str]]]:
+        """
+        Step 1 for several independent chunks (different meetings) in one LLM call
+        
+        Each chunk is sent as a labeled segment [1]..[N] with its own meeting
+        context, and the reply is split back per segment.
+        
+        Returns: ideas per chunk, or None where the reply had no usable entry
+        (the caller then falls back to _extract_ideas for that chunk)
+        """
+        gpt_start = time.time()
+        try:
+            contexts = await asyncio.gather(*[self._build_extraction_context(chunk) for chunk in chunks])
+        except Exception as e:
+            logger.error("    ❌ Could not build batched extraction context, falling back per chunk: %s", e)
+            return [None] * len(chunks)
+        
+        segments = []
+        for label, (chunk, context_str) in enumerate(zip(chunks, contexts), 1):
+            segments.append(f'[{label}]\n{context_str}\n\nCurrent chunk: "{chunk.text}"')
+        segments_str = "\n\n".join(segments)
+        
+        prompt = f"""You are analyzing {len(chunks)} unrelated conversation transcript chunks, labeled [1]..[{len(chunks)}].
+Each segment has its own conversation context; never mix ideas between segments.
+
+{segments_str}
+
+For EACH segment, extract distinct ideas, decisions, actions, or proposals from its current chunk,
+using that segment's context to understand where its conversation is heading.
+Extract each distinct idea as a short, self-contained summary (1-2 sentences max).
+
+Return JSON with one entry per segment label:
+{{
+  "segments": {{
+    "1": ["idea description 1", "idea description 2"],
+    "2": []
+  }}
+}}
+
+IMPORTANT:
+- Return ONLY idea descriptions (short summaries)
+- Do NOT make any decisions about graph structure
+- Do NOT reference existing nodes by ID
+
+Return ONLY the JSON object, no other text."""
+        
+        try:
+            logger.info("    Calling OpenAI API for %s batched chunk(s) (model: gpt-4o-mini)...", len(chunks))
+            response = await self.chat_completion(
+                model=EXTRACTION_MODEL,
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "You are an expert at extracting clear, concise ideas from conversation transcripts. Return only valid JSON."
+                    },
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.3,
+                max_tokens=500 * len(chunks)
+            )
+            by_label = self._parse_json_content(response.choices[0].message.content).get("segments", {})
+        except Exception as e:
+            logger.error("    ❌ Batched idea extraction failed, falling back per chunk: %s", e)
+            return [None] * len(chunks)
+        
+        results: List[Optional[List[str]]] = []
+        for label in range(1, len(chunks) + 1):
+            ideas = by_label.get(str(label))
+            if isinstance(ideas, list):
+                results.append([idea.strip() for idea in ideas if isinstance(idea, str) and idea.strip()])
+            else:
+                results.append(None)
+        logger.info("    Batched extraction of %s chunk(s) took %.2fs", len(chunks), time.time() - gpt_start)
+        return results
+    
+    async def _extract_ideas(self, chunk: TranscriptChunk) -> List[str]:
+        """
+        Step 1: Extract idea descriptions from transcript chunk
+        GPT's ONLY role - no graph decisions, no parent selection
+        Includes context from recent chunks' nodes
+        """
+        gpt_start = time.time()
+        logger.info("    Preparing GPT prompt (chunk length: %s chars)...", len(chunk.text))
+        
+        context_str = await self._build_extraction_context(chunk)
         
         prompt = f"""You are analyzing a conversation transcript chunk.
 
@@ -267,9 +626,9 @@ Return ONLY the JSON object, no other text."""
 
         try:
             api_start = time.time()
-            print(f"[{time.strftime('%H:%M:%S')}]     Calling OpenAI API (model: gpt-4o-mini)...")
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
+            logger.info("    Calling OpenAI API (model: gpt-4o-mini)...")
+            response = await self.chat_completion(
+                model=EXTRACTION_MODEL,
                 messages=[
                     {
                         "role": "system",
@@ -281,35 +640,25 @@ Return ONLY the JSON object, no other text."""
                 max_tokens=500
             )
             api_elapsed = time.time() - api_start
-            print(f"[{time.strftime('%H:%M:%S')}]     OpenAI API responded in {api_elapsed:.2f}s")
+            logger.info("    OpenAI API responded in %.2fs", api_elapsed)
             
             parse_start = time.time()
-            content = response.choices[0].message.content.strip()
-            
-            # Parse JSON (handle markdown code blocks)
-            if content.startswith("```"):
-                content = content.split("```")[1]
-                if content.startswith("json"):
-                    content = content[4:]
-            
-            extracted = json.loads(content)
+            extracted = self._parse_json_content(response.choices[0].message.content)
             ideas = extracted.get("ideas", [])
             
             # Filter out empty ideas
             ideas = [idea.strip() for idea in ideas if idea.strip()]
             parse_elapsed = time.time() - parse_start
-            print(f"[{time.strftime('%H:%M:%S')}]     Parsed response in {parse_elapsed:.3f}s - found {len(ideas)} idea(s)")
+            logger.info("    Parsed response in %.3fs - found %s idea(s)", parse_elapsed, len(ideas))
             
             total_elapsed = time.time() - gpt_start
-            print(f"[{time.strftime('%H:%M:%S')}]     GPT extraction total: {total_elapsed:.2f}s (API: {api_elapsed:.2f}s, parse: {parse_elapsed:.3f}s)")
+            logger.info("    GPT extraction total: %.2fs (API: %.2fs, parse: %.3fs)", total_elapsed, api_elapsed, parse_elapsed)
             
             return ideas
             
         except Exception as e:
             elapsed = time.time() - gpt_start
-            print(f"[{time.strftime('%H:%M:%S')}]     ❌ Error extracting ideas after {elapsed:.2f}s: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("    ❌ Error extracting ideas after %.2fs: %s", elapsed, e)
             return []
     
     async def _graph_to_frontend_format(
@@ -481,7 +830,7 @@ IMPORTANT:
 Return ONLY the JSON object, no other text."""
 
         try:
-            response = self.client.chat.completions.create(
+            response = await self.chat_completion(
                 model="gpt-4o-mini",
                 messages=[
                     {
@@ -494,15 +843,7 @@ Return ONLY the JSON object, no other text."""
                 max_tokens=300
             )
             
-            content = response.choices[0].message.content.strip()
-            
-            # Parse JSON (handle markdown code blocks)
-            if content.startswith("```"):
-                content = content.split("```")[1]
-                if content.startswith("json"):
-                    content = content[4:]
-            
-            extracted = json.loads(content)
+            extracted = self._parse_json_content(response.choices[0].message.content)
             decision = extracted.get("decision", "branch")
             target_node_id = extracted.get("target_node_id")
             parent_id = extracted.get("parent_id")
@@ -511,7 +852,7 @@ Return ONLY the JSON object, no other text."""
             # Validate target_node_id exists in similar_nodes
             valid_node_ids = {node_id for node_id, _, _ in similar_nodes}
             if target_node_id and target_node_id not in valid_node_ids:
-                print(f"      ⚠️ LLM returned invalid target_node_id: {target_node_id}, using fallback")
+                logger.warning("      ⚠️ LLM returned invalid target_node_id: %s, using fallback", target_node_id)
                 target_node_id = similar_nodes[0][0]  # Use first similar node
             
             # Get appropriate root ID (meeting-specific)
@@ -523,7 +864,7 @@ Return ONLY the JSON object, no other text."""
             
             # Enforce placement rules based on decision type
             if target_node_id:
-                target_node = await self.graph_manager.get_node(target_node_id, meeting_id_for_placement)
+                target_node = await self.graph_manager.get_node_header(target_node_id, meeting_id_for_placement)
                 if target_node:
                     if decision == "continuation" or decision == "resolution":
                         # Place as child of target node
@@ -542,11 +883,11 @@ Return ONLY the JSON object, no other text."""
                 parent_id = fallback_root_id
             
             # Final validation: ensure parent_id exists in graph
-            parent_check = await self.graph_manager.get_node(parent_id, meeting_id_for_placement)
+            parent_check = await self.graph_manager.get_node_header(parent_id, meeting_id_for_placement)
             if not parent_check:
-                print(f"      ⚠️ LLM returned invalid parent_id: {parent_id}, using fallback")
+                logger.warning("      ⚠️ LLM returned invalid parent_id: %s, using fallback", parent_id)
                 if target_node_id:
-                    target_node = await self.graph_manager.get_node(target_node_id, meeting_id_for_placement)
+                    target_node = await self.graph_manager.get_node_header(target_node_id, meeting_id_for_placement)
                     if target_node:
                         parent_id = target_node.parent_id if target_node.parent_id else fallback_root_id
                     else:
@@ -555,20 +896,18 @@ Return ONLY the JSON object, no other text."""
                     parent_id = fallback_root_id
             
             # Get parent node description for logging
-            parent_node = await self.graph_manager.get_node(parent_id, meeting_id_for_placement)
+            parent_node = await self.graph_manager.get_node_header(parent_id, meeting_id_for_placement)
             parent_description = parent_node.summary if parent_node else "N/A"
             
-            print(f"      → LLM Decision:")
-            print(f"        Decision type: {decision}")
-            print(f"        Target node: {target_node_id}")
-            print(f"        Parent node: '{parent_description}' (id: {parent_id})")
-            print(f"        Reasoning: {reasoning}")
+            logger.debug("      → LLM Decision:")
+            logger.debug("        Decision type: %s", decision)
+            logger.debug("        Target node: %s", target_node_id)
+            logger.debug("        Parent node: '%s' (id: %s)", parent_description, parent_id)
+            logger.debug("        Reasoning: %s", reasoning)
             return parent_id
             
         except Exception as e:
-            print(f"      ❌ Error in LLM placement decision: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("      ❌ Error in LLM placement decision: %s", e)
             # Get appropriate root ID (meeting-specific)
             meeting_id_for_fallback = meeting_id if meeting_id else None
             if not meeting_id_for_fallback:
@@ -638,7 +977,7 @@ IMPORTANT:
 Return ONLY the summary text."""
 
         try:
-            response = self.client.chat.completions.create(
+            response = await self.chat_completion(
                 model="gpt-4o-mini",
                 messages=[
                     {
@@ -664,6 +1003,6 @@ Return ONLY the summary text."""
             return summary
             
         except Exception as e:
-            print(f"[ERROR] Error generating path summary: {e}")
+            logger.error("[ERROR] Error generating path summary: %s", e)
             # Fallback: simple concatenation
             return ". ".join(filtered_summaries[:3]) + "."
@@ -44,7 +44,7 @@ class MergeService:
             topic_node_mapping=topic_node_mapping
         )
         
-        result = merged_data.dict()
+        result = merged_data.model_dump()
         print(f"Merge: Result dict has {len(result.get('nodes', []))} nodes")
         return result
     
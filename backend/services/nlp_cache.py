@@ -0,0 +1,10 @@
+"""
+NLP Cache - NLTK resources loaded once per process
+Corpora are parsed at import time and pinned in module-level constants,
+so keyword extractors never re-read them from disk per request
+"""
+
+from nltk.corpus import stopwords
+
+# English stopword list used by RAKE keyword extraction
+STOPWORDS = frozenset(stopwords.words('english'))
@@ -4,8 +4,8 @@ Handles real-time transcription using OpenAI Realtime API
 """
 
 import os
-import json
 import asyncio
+import traceback
 from openai import OpenAI
 from typing import List, Optional, AsyncIterator
 from models.schemas import TranscriptChunk
@@ -198,7 +198,6 @@ class STTService:
             
         except Exception as e:
             print(f"❌ Error transcribing audio file: {e}")
-            import traceback
             traceback.print_exc()
             return []
     
@@ -11,6 +11,7 @@ from sklearn.cluster import DBSCAN
 from keybert import KeyBERT
 from rake_nltk import Rake
 from models.schemas import TranscriptChunk, TopicData
+from services.nlp_cache import STOPWORDS
 
 class TalkTracesService:
     """Service for topic detection and tracking"""
@@ -19,7 +20,7 @@ class TalkTracesService:
         # Initialize models
         self.embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
         self.keybert_model = KeyBERT()
-        self.rake = Rake()
+        self.rake = Rake(stopwords=set(STOPWORDS))  # Reuse the cached corpus
         
         # Topic tracking
         self.active_topics: List[TopicData] = []
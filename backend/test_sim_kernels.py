@@ -0,0 +1,113 @@
+"""
+Test script for the DB-free similarity and batching helpers
+(services/sim_kernels.py, services/embedding_store.py, services/batcher.py)
+Run directly or with pytest - no database or model needed
+"""
+
+import asyncio
+
+import numpy as np
+
+from services.batcher import AsyncBatcher
+from services.embedding_store import EmbeddingStore
+from services.sim_kernels import int8_unit_rows, quantize_int8, top_k_above, unit_rows
+
+
+def brute_force_top_k(matrix, query, threshold, k):
+    """Reference ranking: full argsort, then filter"""
+    scores = matrix @ query
+    order = [i for i in np.argsort(-scores, kind="stable") if scores[i] >= threshold]
+    return order[:k], scores
+
+
+def test_top_k_above():
+    """top_k_above matches a brute-force argsort, threshold and k > N included"""
+    rng = np.random.default_rng(0)
+    matrix = unit_rows(rng.standard_normal((50, 16)))
+    query = unit_rows(rng.standard_normal((1, 16)))[0]
+
+    for threshold, k in [(-np.inf, 5), (0.2, 10), (-np.inf, 500), (0.0, 500), (2.0, 5)]:
+        indices, scores = top_k_above(matrix, query, threshold, k)
+        expected, all_scores = brute_force_top_k(matrix, query, threshold, k)
+        assert list(indices) == expected, (threshold, k)
+        assert np.allclose(scores, all_scores[expected])
+        assert all(score >= threshold for score in scores)
+
+    # Nothing to rank
+    assert top_k_above(matrix, query, -np.inf, 0)[0].size == 0
+    assert top_k_above(np.empty((0, 16), dtype=np.float32), query, -np.inf, 3)[0].size == 0
+    print("top_k_above: OK")
+
+
+def test_int8_unit_rows():
+    """int8 quantization round-trips to (nearly) the same unit rows"""
+    rng = np.random.default_rng(1)
+    vectors = rng.standard_normal((20, 384)).astype(np.float32)
+    quantized = [quantize_int8(vector) for vector in vectors]
+
+    # Each vector ~= int8 values * scale
+    for vector, (buffer, scale) in zip(vectors, quantized):
+        restored = np.frombuffer(buffer, dtype=np.int8).astype(np.float32) * scale
+        assert np.abs(restored - vector).max() <= scale / 2 + 1e-6
+
+    rows = int8_unit_rows([buffer for buffer, _ in quantized])
+    assert rows.shape == vectors.shape
+    assert np.allclose(np.linalg.norm(rows, axis=1), 1, atol=1e-5)
+    assert np.allclose(rows, unit_rows(vectors), atol=0.02)
+
+    # All-zero vectors stay zero instead of dividing by zero
+    zero_buffer, _ = quantize_int8(np.zeros(8))
+    assert not int8_unit_rows([zero_buffer]).any()
+    print("int8_unit_rows: OK")
+
+
+def test_embedding_store():
+    """search ranks stored rows like top_k_above; re-adding replaces a row"""
+    store = EmbeddingStore(capacity=2)
+    store.add("a", [1, 0, 0])
+    store.add("b", [0, 1, 0])
+    store.add("c", [1, 1, 0])  # Grows past the initial capacity
+    assert not store.add("zero", [0, 0, 0])
+
+    assert [node_id for node_id, _ in store.search([1, 0.1, 0], -1, 2)] == ["a", "c"]
+    assert np.allclose(store.get("c"), [1, 1, 0])
+
+    store.add("a", [0, 0, 2])
+    assert len(store) == 3
+    assert store.search([0, 0, 1], 0.99, 5)[0][0] == "a"
+    print("EmbeddingStore: OK")
+
+
+def test_async_batcher():
+    """Results come back per submitter in order; a handler error reaches every submitter"""
+    async def run():
+        calls = []
+
+        async def double(items):
+            calls.append(list(items))
+            return [item * 2 for item in items]
+
+        batcher = AsyncBatcher(double, max_batch=4, flush_ms=20)
+        results = await asyncio.gather(*[batcher.submit(i) for i in range(10)])
+        await batcher.close()
+        assert results == [i * 2 for i in range(10)]
+        assert [item for call in calls for item in call] == list(range(10))
+        assert all(len(call) <= 4 for call in calls)
+
+        async def fail(items):
+            raise RuntimeError("handler failed")
+
+        batcher = AsyncBatcher(fail, max_batch=8, flush_ms=20)
+        outcomes = await asyncio.gather(*[batcher.submit(i) for i in range(3)], return_exceptions=True)
+        await batcher.close()
+        assert all(isinstance(outcome, RuntimeError) for outcome in outcomes)
+
+    asyncio.run(run())
+    print("AsyncBatcher: OK")
+
+
+if __name__ == "__main__":
+    test_top_k_above()
+    test_int8_unit_rows()
+    test_embedding_store()
+    test_async_batcher()